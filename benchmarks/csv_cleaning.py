@@ -0,0 +1,30 @@
+"""Замер скорости чтения и очистки строк task_5_2.DataSet.csv_filer (строк в секунду)
+
+Запуск: python benchmarks/csv_cleaning.py <файл.csv>
+"""
+import pathlib
+import sys
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+
+from task_5_2 import DataSet
+
+
+def measure(name_file):
+    """Читает и очищает все строки файла
+
+    Args:
+        name_file (str): Имя файла
+
+    Returns:
+        tuple: количество очищенных строк и время работы в секундах
+    """
+    start = time.perf_counter()
+    rows_count = sum(1 for _ in DataSet.csv_filer(name_file))
+    return rows_count, time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    rows_count, elapsed = measure(sys.argv[1])
+    print('{0} строк за {1:.2f} с: {2:.0f} строк/с'.format(rows_count, elapsed, rows_count / elapsed))
@@ -0,0 +1,68 @@
+"""Замер времени и пикового потребления памяти vacancy_statistics.ExcelWriter на синтетической статистике:
+книга с листом по годам для каждой профессии и листом по городам, в обычном и потоковом режиме
+
+Запуск: python benchmarks/excel_writer.py [количество профессий] [количество городов]
+"""
+import pathlib
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+
+from vacancy_statistics import ExcelWriter
+
+
+def make_statistics(professions_count, cities_count):
+    """Формирует синтетическую статистику
+
+    Args:
+        professions_count (int): Количество профессий
+        cities_count (int): Количество городов
+
+    Returns:
+        dict: словарь статистики по профессиям (название профессии - кортеж из 6 словарей)
+    """
+    years = range(2007, 2023)
+    salaries = {'Город {0}'.format(city): 100000 - city for city in range(cities_count)}
+    shares = {'Город {0}'.format(city): round(1 / cities_count, 4) for city in range(cities_count)}
+    return {'Профессия {0}'.format(profession): ({year: 50000 + year for year in years},
+                                                 {year: 1000 + year for year in years},
+                                                 {year: 60000 + profession for year in years},
+                                                 {year: profession for year in years}, salaries, shares)
+            for profession in range(professions_count)}
+
+
+def measure(statistics, write_only):
+    """Формирует книгу и измеряет время работы и пиковый объем памяти, выделенной Python
+
+    Args:
+        statistics (dict): Словарь статистики по профессиям
+        write_only (bool): Потоковый режим записи
+
+    Returns:
+        tuple: время работы в секундах и пиковый объем памяти в мегабайтах
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        tracemalloc.start()
+        start = time.perf_counter()
+        writer = ExcelWriter(write_only)
+        for name_vacancy, data in statistics.items():
+            writer.add_years_sheet(name_vacancy, name_vacancy, *data[:4])
+        writer.add_cities_sheet(*list(statistics.values())[-1][4:])
+        writer.save(str(pathlib.Path(directory) / 'report.xlsx'))
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] / 2 ** 20
+        tracemalloc.stop()
+    return elapsed, peak
+
+
+if __name__ == '__main__':
+    professions_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    cities_count = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+    statistics = make_statistics(professions_count, cities_count)
+    for write_only in (False, True):
+        elapsed, peak = measure(statistics, write_only)
+        print('{0}: {1:.2f} с, пик памяти {2:.1f} МБ'.format('потоковый режим' if write_only else 'обычный режим',
+                                                             elapsed, peak))
@@ -0,0 +1,195 @@
+"""Генератор синтетических CSV-файлов с вакансиями для замеров. При одинаковых параметрах и зерне
+генератора файл получается одинаковым байт в байт.
+
+Наборы столбцов:
+    vacancies - все столбцы, которые читает task_5_2.DataSet.csv_filer (вывод вакансий);
+    statistics - столбцы vacancy_statistics.Vacancy (статистика task_2_1_1, task_2_1_2, task_2_1_3).
+Файл набора vacancies подходит и для статистики: лишние столбцы ей не мешают.
+
+Описания содержат html разметку (абзацы, списки, выделение, сущности), часть строк содержит пустые ячейки
+или другое количество значений (такие строки обе программы отбрасывают)
+
+Запуск: python benchmarks/make_vacancies.py <файл.csv> <количество строк> [--columns vacancies|statistics]
+    [--seed N] [--description-length N] [--missing-share X] [--ragged-share X] [--currency RUR=0.8 USD=0.1 ...]
+"""
+import argparse
+import csv
+import pathlib
+import random
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+
+from vacancy_statistics import Vacancy
+
+columns = {'vacancies': ['name', 'description', 'key_skills', 'experience_id', 'premium', 'employer_name',
+                         'salary_from', 'salary_to', 'salary_gross', 'salary_currency', 'area_name', 'published_at'],
+           'statistics': ['name', 'salary_from', 'salary_to', 'salary_currency', 'area_name', 'published_at']}
+currencies = {'RUR': 0.8, 'USD': 0.05, 'EUR': 0.04, 'KZT': 0.03, 'UAH': 0.02, 'BYR': 0.02, 'UZS': 0.01,
+              'KGS': 0.01, 'GEL': 0.01, 'AZN': 0.01}
+names = ['Программист', 'Программист Python', 'Программист C++', 'Java разработчик', 'Frontend-разработчик',
+         'Аналитик', 'Системный аналитик', 'Тестировщик', 'Инженер-программист', 'Менеджер проектов',
+         'Дизайнер интерфейсов', 'DevOps-инженер', 'Администратор баз данных', 'Специалист технической поддержки']
+cities = ['Москва', 'Санкт-Петербург', 'Новосибирск', 'Екатеринбург', 'Казань', 'Нижний Новгород', 'Самара',
+          'Омск', 'Ростов-на-Дону', 'Уфа', 'Пермь', 'Воронеж', 'Краснодар', 'Тула', 'Сочи', 'Калининград',
+          'Томск', 'Ярославль']
+skills = ['Python', 'SQL', 'Git', 'Linux', 'Docker', 'Java', 'C++', 'JavaScript', 'PostgreSQL', 'Английский язык',
+          'Kubernetes', 'REST API', 'Django', 'React', 'MS Excel', 'Atlassian Jira', 'ООП', 'Kotlin']
+experiences = ['noExperience', 'between1And3', 'between3And6', 'moreThan6']
+words = ['разработка', 'поддержка', 'проектирование', 'команда', 'продукт', 'сервис', 'задачи', 'опыт', 'знание',
+         'клиенты', 'высоконагруженных', 'систем', 'участие', 'code review', 'офис', 'удаленно', 'график',
+         'оформление', 'ДМС', 'обучение', 'конференции', 'рост', 'доход', 'стабильный', 'современный', 'стек']
+
+
+def make_paragraphs(generator, count=512):
+    """Формирует набор фрагментов описаний с html разметкой: абзацы с выделением и сущностями
+    и маркированные списки (в среднем около 150 символов). Описания вакансий собираются из этих фрагментов
+
+    Args:
+        generator (Random): Генератор случайных чисел
+        count (int): Количество фрагментов
+
+    Returns:
+        list: фрагменты
+    """
+    paragraphs = []
+    for _ in range(count):
+        text = ' '.join(generator.choices(words, k=generator.randint(6, 14)))
+        if generator.random() < 0.5:
+            paragraphs.append('<p><strong>{0}</strong>&nbsp;{1}</p>'.format(text[:20], text[20:]))
+        else:
+            items = ''.join('<li>{0}</li>'.format(item) for item in text.split(' ', 3))
+            paragraphs.append('<ul>{0}</ul>\n<p>&quot;{1}&quot; <em>&amp;</em>  <br /></p>'.format(items, text[:15]))
+    return paragraphs
+
+
+def make_description(generator, paragraphs, length):
+    """Формирует описание вакансии из фрагментов
+
+    Args:
+        generator (Random): Генератор случайных чисел
+        paragraphs (list): Фрагменты описаний (см. make_paragraphs)
+        length (int): Примерная длина описания в символах
+
+    Returns:
+        str: описание
+    """
+    parts = generator.choices(paragraphs, k=max(round(length / 150), 1))
+    return '<div class="vacancy">' + '\n'.join(parts) + '</div>'
+
+
+def make_row(generator, number, year, paragraphs, description_length, currency_names, currency_weights):
+    """Формирует строку набора vacancies. Зарплата задается в валюте вакансии (по курсу Vacancy.currency_to_rub
+    соответствует 10 000 - 450 000 руб.). Дата публикации каждой тысячной строки записывается
+    со смещением вида +03:00 (разбирается не срезами, а через strptime)
+
+    Args:
+        generator (Random): Генератор случайных чисел
+        number (int): Номер строки
+        year (int): Год публикации
+        paragraphs (list): Фрагменты описаний (None - описание и навыки не нужны и не формируются)
+        description_length (int): Примерная длина описания в символах
+        currency_names (list): Валюты
+        currency_weights (list): Доли валют
+
+    Returns:
+        list: значения ячеек в порядке columns['vacancies']
+    """
+    salary_currency = generator.choices(currency_names, currency_weights)[0]
+    rate = Vacancy.currency_to_rub[salary_currency]
+    salary_from = generator.randrange(10, 300) * 1000
+    salary_to = salary_from + generator.randrange(0, 150) * 1000
+    salary_from, salary_to = (max(int(salary / rate) // 100 * 100, 100) for salary in (salary_from, salary_to))
+    published_at = '{0}-{1:02}-{2:02}T{3:02}:{4:02}:{5:02}{6}'.format(
+        year, generator.randint(1, 12), generator.randint(1, 28), generator.randrange(24),
+        generator.randrange(60), generator.randrange(60), generator.choice(('+0300', '+0300', '+0500', '+0000')))
+    employer_name = 'Компания {0}'.format(generator.randrange(1, 5000))
+    if generator.random() < 0.05:
+        employer_name = '<b>{0}</b>  &laquo;Групп&raquo;'.format(employer_name)
+    description = key_skills = ''
+    if paragraphs is not None:
+        description = make_description(generator, paragraphs, description_length)
+        key_skills = '\n'.join(generator.sample(skills, generator.randint(1, 6)))
+    return [generator.choice(names), description, key_skills, generator.choice(experiences),
+            generator.choice(('True', 'False')), employer_name, '{0}.0'.format(salary_from),
+            '{0}.0'.format(salary_to), generator.choice(('True', 'False')),
+            salary_currency, generator.choice(cities),
+            published_at if number % 1000 else published_at[:22] + ':' + published_at[22:]]
+
+
+def generate(name_file, rows_count, columns_set='vacancies', seed=0, description_length=600, missing_share=0.02,
+             ragged_share=0.01, currency_shares=None):
+    """Записывает синтетический CSV-файл с вакансиями. Как и в выгрузках вакансий, строки идут
+    в порядке возрастания годов публикации (2007 - 2022)
+
+    Args:
+        name_file (str): Имя файла
+        rows_count (int): Количество строк (без строки заголовков)
+        columns_set (str): Набор столбцов (ключ columns)
+        seed (int): Зерно генератора случайных чисел
+        description_length (int): Примерная длина описания в символах
+        missing_share (float): Доля строк с пустой ячейкой
+        ragged_share (float): Доля строк с другим количеством значений
+        currency_shares (dict): Доли валют (валюта - доля), по умолчанию - currencies
+    """
+    currency_shares = currency_shares or currencies
+    for currency in currency_shares:
+        if currency not in Vacancy.currency_to_rub:
+            print('Неизвестная валюта: {0}'.format(currency))
+            exit()
+    currency_names = list(currency_shares)
+    currency_weights = list(currency_shares.values())
+    positions = [columns['vacancies'].index(column) for column in columns[columns_set]]
+    generator = random.Random(seed)
+    paragraphs = make_paragraphs(generator) if 'description' in columns[columns_set] else None
+    with open(name_file, mode='w', encoding='utf-8-sig', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(columns[columns_set])
+        for start in range(0, rows_count, 10000):
+            rows = []
+            for number in range(start, min(start + 10000, rows_count)):
+                inf = make_row(generator, number, 2007 + number * 16 // rows_count, paragraphs, description_length,
+                               currency_names, currency_weights)
+                row = [inf[position] for position in positions]
+                if generator.random() < missing_share:
+                    row[generator.randrange(len(row))] = ''
+                if generator.random() < ragged_share:
+                    row = row[:-generator.randint(1, 2)] if generator.random() < 0.5 else row + ['']
+                rows.append(row)
+            writer.writerows(rows)
+
+
+def parse_currency_shares(items):
+    """Разбирает доли валют вида RUR=0.8
+
+    Args:
+        items (list): Строки вида валюта=доля
+
+    Returns:
+        dict: доли валют (валюта - доля)
+    """
+    currency_shares = {}
+    for item in items:
+        currency, _, share = item.partition('=')
+        try:
+            currency_shares[currency] = float(share)
+        except ValueError:
+            print('Неверно задана доля валюты: {0}'.format(item))
+            exit()
+    return currency_shares
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Генерация синтетического CSV-файла с вакансиями')
+    parser.add_argument('file', help='Имя файла')
+    parser.add_argument('rows', type=int, help='Количество строк')
+    parser.add_argument('--columns', choices=list(columns), default='vacancies', help='Набор столбцов')
+    parser.add_argument('--seed', type=int, default=0, help='Зерно генератора случайных чисел')
+    parser.add_argument('--description-length', type=int, default=600, help='Примерная длина описания')
+    parser.add_argument('--missing-share', type=float, default=0.02, help='Доля строк с пустой ячейкой')
+    parser.add_argument('--ragged-share', type=float, default=0.01,
+                        help='Доля строк с другим количеством значений')
+    parser.add_argument('--currency', nargs='+', default=[], help='Доли валют, например RUR=0.9 USD=0.1')
+    arguments = parser.parse_args()
+    generate(arguments.file, arguments.rows, arguments.columns, arguments.seed, arguments.description_length,
+             arguments.missing_share, arguments.ragged_share, parse_currency_shares(arguments.currency))
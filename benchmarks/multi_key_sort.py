@@ -0,0 +1,53 @@
+"""Замер сортировки по нескольким параметрам в task_5_2.InputConect.make_sort: полная сортировка, выбор первых
+вакансий по составным ключам и сравнение с сортировкой по одному параметру
+
+Запуск: python benchmarks/multi_key_sort.py <файл.csv>
+"""
+import pathlib
+import sys
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+
+from task_5_2 import DataSet, InputConect
+
+PARAMETERS = ['Оклад', 'Дата публикации вакансии', 'Название региона']
+DIRECTIONS = [True, False, True]
+
+
+def make_dic_sorting(table):
+    """Формирует словарь функций сортировки так же, как InputConect.data_processing
+
+    Args:
+        table (VacancyTable): Таблица вакансий
+
+    Returns:
+        dict: словарь функций для сортировки (по номеру строки)
+    """
+    return {'Оклад': table.salary_rub.__getitem__,
+            'Дата публикации вакансии': table.published_timestamp.__getitem__,
+            'Название региона': table.area_name.__getitem__}
+
+
+if __name__ == '__main__':
+    table = DataSet(sys.argv[1]).vacancies_table
+    dic_sorting = make_dic_sorting(table)
+    rows = list(range(len(table)))
+
+    start = time.perf_counter()
+    InputConect.make_sort(rows, PARAMETERS[0], DIRECTIONS[0], dic_sorting)
+    single_key_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    multi_key = InputConect.make_sort(rows, PARAMETERS, DIRECTIONS, dic_sorting)
+    multi_key_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    top = InputConect.make_sort(rows, PARAMETERS, DIRECTIONS, dic_sorting, limit=20)
+    top_time = time.perf_counter() - start
+
+    print('{0} строк'.format(len(rows)))
+    print('Один параметр: {0:.3f} с'.format(single_key_time))
+    print('Несколько параметров: {0:.3f} с'.format(multi_key_time))
+    print('Несколько параметров, первые 20 вакансий: {0:.3f} с'.format(top_time))
+    print('Результаты совпадают' if top == multi_key[:20] else 'Результаты различаются!')
@@ -0,0 +1,80 @@
+"""Проверка индекса окладов task_5_2 (VacancyIndex, IntervalTree): в синтетическом файле (см. make_vacancies.py)
+у части вакансий нижняя граница оклада больше верхней. Индекс должен строиться за конечное время, а поиск
+по окладу и по диапазону окладов - находить те же вакансии, что и перебор строк с условиями фильтрации
+InputConect.data_processing. При расхождении программа завершается с кодом 1
+
+Запуск: python benchmarks/salary_index_check.py [количество строк] [--seed N]
+"""
+import argparse
+import csv
+import pathlib
+import random
+import sys
+import tempfile
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+
+import task_5_2
+from make_vacancies import generate
+
+
+def invert_salaries(name_file, share, generator):
+    """Меняет местами границы оклада у доли строк файла
+
+    Args:
+        name_file (str): Имя файла
+        share (float): Доля строк
+        generator (Random): Генератор случайных чисел
+    """
+    with open(name_file, encoding='utf-8-sig', newline='') as file:
+        rows = list(csv.reader(file))
+    salary_from, salary_to = rows[0].index('salary_from'), rows[0].index('salary_to')
+    for row in rows[1:]:
+        if len(row) == len(rows[0]) and generator.random() < share:
+            row[salary_from], row[salary_to] = row[salary_to], row[salary_from]
+    with open(name_file, mode='w', encoding='utf-8-sig', newline='') as file:
+        csv.writer(file).writerows(rows)
+
+
+def scan(table, low, high):
+    """Находит вакансии, оклад которых пересекается с отрезком [low, high], перебором строк
+
+    Args:
+        table (VacancyTable): Таблица вакансий
+        low (int): Начало отрезка
+        high (int): Конец отрезка
+
+    Returns:
+        list: номера строк в порядке возрастания
+    """
+    return [row for row, (salary_from, salary_to) in enumerate(zip(table.salary_from, table.salary_to))
+            if low <= int(float(salary_to)) and int(float(salary_from)) <= high]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Проверка индекса окладов')
+    parser.add_argument('rows', type=int, nargs='?', default=5000, help='Количество строк')
+    parser.add_argument('--seed', type=int, default=0, help='Зерно генератора случайных чисел')
+    arguments = parser.parse_args()
+    generator = random.Random(arguments.seed)
+    with tempfile.TemporaryDirectory() as directory:
+        name_file = str(pathlib.Path(directory) / 'vacancies.csv')
+        generate(name_file, arguments.rows, seed=arguments.seed)
+        invert_salaries(name_file, 0.2, generator)
+        data_set = task_5_2.DataSet(name_file)
+    table, index = data_set.vacancies_table, data_set.vacancies_index
+    print('Вакансий: {0}, из них с перевернутым окладом: {1}'.format(len(table.salary_from),
+                                                                     len(index.inverted_salaries)))
+    salaries = [int(float(salary)) for salary in table.salary_from + table.salary_to]
+    mismatches = 0
+    for _ in range(200):
+        point = generator.choice(salaries) + generator.choice((-100, 0, 100))
+        low, high = sorted(generator.sample(salaries, 2))
+        for parameter, sample, expected in (('Оклад', str(point), scan(table, point, point)),
+                                            ('Оклад_range', (low, high), scan(table, low, high))):
+            if index.find(parameter, sample) != expected:
+                mismatches += 1
+                print('Расхождение: {0} {1}'.format(parameter, sample))
+    print('Запросов с расхождениями: {0} из 400'.format(mismatches))
+    if mismatches:
+        sys.exit(1)
@@ -0,0 +1,65 @@
+"""Проверка разбиения файла на диапазоны для vacancy_statistics.DataSet.make_statistic_parallel (split_file).
+Синтетический файл (см. make_vacancies.py) содержит переносы строк внутри значений в кавычках (описания
+и навыки). Файл делится на разное количество диапазонов, в том числе с маленьким блоком просмотра, чтобы записи
+пересекали границы блоков. Количество вакансий и статистика, собранные по диапазонам, сравниваются с потоковым
+чтением (make_statistic). При расхождении программа завершается с кодом 1
+
+Запуск: python benchmarks/split_file_check.py [количество строк] [профессия]
+"""
+import csv
+import pathlib
+import sys
+import tempfile
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+
+from make_vacancies import generate
+from vacancy_statistics import Accumulator, DataSet, accumulate_chunk
+
+
+def check_chunks(data_set, expected_rows, expected, chunks_count, block_size):
+    """Собирает статистику по диапазонам файла в текущем процессе и сравнивает ее с ожидаемой
+
+    Args:
+        data_set (DataSet): Данные файла и профессия
+        expected_rows (int): Количество вакансий при потоковом чтении
+        expected (tuple): Статистика при потоковом чтении
+        chunks_count (int): Желаемое количество диапазонов
+        block_size (int): Размер блока просмотра в байтах
+
+    Returns:
+        bool: True, если количество вакансий и статистика совпадают
+    """
+    headings, chunks = data_set.split_file(chunks_count, block_size)
+    rows = 0
+    wages, vacancy_wages, city_wages = Accumulator(), Accumulator(), Accumulator()
+    for start, end in chunks:
+        reader = csv.reader(DataSet.read_chunk(data_set.name_file, start, end))
+        rows += sum(1 for _ in DataSet.rows_to_dicts(headings, reader))
+        chunk_wages, chunk_vacancy_wages, chunk_city_wages = accumulate_chunk(data_set.name_file,
+                                                                              data_set.name_vacancy, headings,
+                                                                              start, end)
+        wages.merge(chunk_wages)
+        vacancy_wages.merge(chunk_vacancy_wages)
+        city_wages.merge(chunk_city_wages)
+    is_equal = rows == expected_rows and data_set.make_result(wages, vacancy_wages, city_wages) == expected
+    print('{0} диапазонов (получено {1}), блок {2} байт: {3} вакансий - {4}'.format(
+        chunks_count, len(chunks), block_size, rows, 'совпадает' if is_equal else 'РАСХОДИТСЯ'))
+    return is_equal
+
+
+if __name__ == '__main__':
+    rows_count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    name_vacancy = sys.argv[2] if len(sys.argv) > 2 else 'Программист'
+    with tempfile.TemporaryDirectory() as directory:
+        name_file = str(pathlib.Path(directory) / 'vacancies.csv')
+        generate(name_file, rows_count)
+        data_set = DataSet(name_file, name_vacancy)
+        expected_rows = sum(1 for _ in data_set.csv_reader())
+        expected = data_set.make_statistic()
+        results = [check_chunks(data_set, expected_rows, expected, chunks_count, block_size)
+                   for block_size in (1 << 20, 997) for chunks_count in (1, 2, 7, 64, rows_count)]
+        is_parallel_equal = data_set.make_statistic_parallel() == expected
+        print('make_statistic_parallel: {0}'.format('совпадает' if is_parallel_equal else 'РАСХОДИТСЯ'))
+    if not all(results) or not is_parallel_equal:
+        sys.exit(1)
@@ -0,0 +1,45 @@
+"""Замер времени запуска: время импорта модулей программы по данным python -X importtime
+
+Для каждого сценария запускается отдельный интерпретатор, импортирующий модули сценария,
+время берется из накопленного времени импорта (cumulative) модулей верхнего уровня.
+Для каждого сценария выводится медиана по нескольким запускам
+
+Запуск: python benchmarks/startup_time.py [количество запусков]
+"""
+import pathlib
+import statistics
+import subprocess
+import sys
+
+root = pathlib.Path(__file__).resolve().parent.parent
+
+scenarios = {'main_2_2_2': ['main_2_2_2'],
+             'Вакансии (main_2_2_2 + task_5_2)': ['main_2_2_2', 'task_5_2'],
+             'Статистика (main_2_2_2 + vacancy_statistics)': ['main_2_2_2', 'vacancy_statistics']}
+
+
+def measure(modules):
+    """Импортирует модули в отдельном интерпретаторе
+
+    Args:
+        modules (list): Названия модулей
+
+    Returns:
+        float: суммарное время импорта модулей в секундах
+    """
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import ' + ', '.join(modules)],
+                             cwd=root, capture_output=True, text=True, check=True)
+    cumulative = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_time, cumulative_time, name = line[len('import time:'):].split('|')
+        if not name.startswith(' ' * 2):
+            cumulative[name.strip()] = int(cumulative_time)
+    return sum(cumulative.get(module, 0) for module in modules) / 1e6
+
+
+if __name__ == '__main__':
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    for title, modules in scenarios.items():
+        print('{0}: {1:.3f} с'.format(title, statistics.median(measure(modules) for _ in range(runs))))
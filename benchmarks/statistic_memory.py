@@ -0,0 +1,34 @@
+"""Замер пикового потребления памяти при формировании статистики vacancy_statistics.DataSet.make_statistic
+
+Запуск: python benchmarks/statistic_memory.py <файл.csv> <профессия>
+"""
+import pathlib
+import resource
+import sys
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+
+from vacancy_statistics import DataSet
+
+
+def measure(name_file, name_vacancy):
+    """Формирует статистику и измеряет время работы и пиковый размер резидентной памяти процесса
+
+    Args:
+        name_file (str): Имя файла
+        name_vacancy (str): Название профессии
+
+    Returns:
+        tuple: время работы в секундах и пиковый RSS в мегабайтах
+    """
+    start = time.perf_counter()
+    DataSet(name_file, name_vacancy).make_statistic()
+    elapsed = time.perf_counter() - start
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return elapsed, peak_rss
+
+
+if __name__ == '__main__':
+    elapsed, peak_rss = measure(sys.argv[1], sys.argv[2])
+    print('Время: {0:.2f} с, пиковый RSS: {1:.1f} МБ'.format(elapsed, peak_rss))
@@ -0,0 +1,36 @@
+"""Сравнение времени подсчета статистики vacancy_statistics.DataSet при потоковом чтении файла
+и векторными операциями по колоночным данным (make_statistics, загрузка данных входит в замер)
+
+Запуск: python benchmarks/statistic_vectorized.py <файл.csv> <профессия>
+"""
+import pathlib
+import sys
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+
+from vacancy_statistics import DataSet
+
+
+def measure(function):
+    """Измеряет время работы функции
+
+    Args:
+        function (function): Функция без аргументов
+
+    Returns:
+        tuple: время работы в секундах и результат функции
+    """
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+if __name__ == '__main__':
+    data_set = DataSet(sys.argv[1], sys.argv[2])
+    serial_time, serial_result = measure(lambda: data_set.make_result(*data_set.accumulate(data_set.csv_reader())))
+    vectorized_time, vectorized_result = measure(
+        lambda: data_set.make_statistics([data_set.name_vacancy], data_set.load_columns())[data_set.name_vacancy])
+    print('Потоковое чтение: {0:.2f} с'.format(serial_time))
+    print('make_statistics: {0:.2f} с (x{1:.1f})'.format(vectorized_time, serial_time / vectorized_time))
+    print('Результаты совпадают' if serial_result == vectorized_result else 'Результаты различаются!')
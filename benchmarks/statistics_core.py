@@ -0,0 +1,98 @@
+"""Общий замер модуля vacancy_statistics, на котором построены task_2_1_1, task_2_1_2 и task_2_1_3:
+время каждого способа сбора статистики (потоковое чтение, несколько процессов, файлы по годам,
+векторные операции по колоночным данным) и каждого модуля вывода (console, excel, image, pdf).
+Для каждого замера выводится медиана по нескольким запускам, результаты всех способов сбора сравниваются
+с потоковым чтением
+
+Запуск: python benchmarks/statistics_core.py <файл.csv> <профессия> [количество запусков]
+"""
+import contextlib
+import io
+import pathlib
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+
+from vacancies_cache import ColumnarCache
+from vacancy_statistics import DataSet, InputConnect, OutputSpec, Report, render_stage
+
+
+def measure(function, runs):
+    """Запускает функцию несколько раз и измеряет время работы
+
+    Args:
+        function (function): Функция без аргументов
+        runs (int): Количество запусков
+
+    Returns:
+        tuple: медиана времени работы в секундах и результат последнего запуска
+    """
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = function()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), result
+
+
+def make_ingestion_paths(data_set, directory):
+    """Формирует способы сбора статистики. Файлы по годам и колоночные данные готовятся заранее
+    и в замер не входят (колоночные данные строятся в памяти, кэш рядом с файлом не создается)
+
+    Args:
+        data_set (DataSet): Данные файла и профессия
+        directory (str): Временная папка для файлов по годам
+
+    Returns:
+        dict: словарь способов (название - функция без аргументов, возвращающая кортеж из 6 словарей)
+    """
+    data_set.split_by_years(directory)
+    columns = ColumnarCache.encode(data_set.csv_reader())
+    return {'csv_reader': lambda: data_set.make_result(*data_set.accumulate(data_set.csv_reader())),
+            'make_statistic_parallel': data_set.make_statistic_parallel,
+            'make_statistic_by_years': lambda: data_set.make_statistic_by_years(directory),
+            'make_statistics': lambda: data_set.make_statistics([data_set.name_vacancy],
+                                                                columns)[data_set.name_vacancy]}
+
+
+def make_sinks(name_vacancy, statistic, directory):
+    """Формирует модули вывода: console и этапы Report.stages. Каждый запуск изображения строится заново
+    (кэш изображений - новая временная папка)
+
+    Args:
+        name_vacancy (str): Название профессии
+        statistic (tuple): Кортеж из 6 словарей статистики
+        directory (str): Временная папка для файлов отчета
+
+    Returns:
+        dict: словарь модулей вывода (название - функция без аргументов)
+    """
+    def output_console():
+        with contextlib.redirect_stdout(io.StringIO()):
+            DataSet.output_statistics(*statistic)
+
+    def output_stage(stage):
+        render_stage(stage, name_vacancy, statistic, OutputSpec(directory, image_cache=tempfile.mkdtemp(dir=directory)))
+
+    sinks = {'console': output_console}
+    for sink in InputConnect.sinks:
+        if sink in Report.stages:
+            sinks[sink] = lambda stage=sink: output_stage(stage)
+    return sinks
+
+
+if __name__ == '__main__':
+    name_file, name_vacancy = sys.argv[1], sys.argv[2]
+    runs = int(sys.argv[3]) if len(sys.argv) > 3 else 3
+    data_set = DataSet(name_file, name_vacancy)
+    with tempfile.TemporaryDirectory() as directory:
+        expected = None
+        for title, function in make_ingestion_paths(data_set, str(pathlib.Path(directory) / 'years')).items():
+            elapsed, result = measure(function, runs)
+            expected = expected or result
+            print('{0}: {1:.3f} с{2}'.format(title, elapsed, '' if result == expected else ' (результат различается!)'))
+        for title, function in make_sinks(name_vacancy, expected, directory).items():
+            print('{0}: {1:.3f} с'.format(title, measure(function, runs)[0]))
@@ -0,0 +1,358 @@
+"""Набор замеров программы на синтетических файлах (см. make_vacancies.py) из 10 тыс., 1 млн и 10 млн строк:
+чтение и очистка, статистика, сортировка, фильтрация, вывод таблицы и модули вывода отчета.
+
+Каждый замер выполняется в отдельном процессе: подготовка (загрузка таблицы, подсчет статистики для модулей
+вывода) в время не входит, время - медиана по нескольким запускам. Для каждого замера записывается пиковый
+размер резидентной памяти его процесса (вместе с подготовкой, без дочерних процессов).
+Результаты записываются в JSON-файл. Если задан файл прошлых результатов (--compare), для каждого замера
+выводится отношение времени к прошлому, а при замедлении больше порога (--threshold) программа завершается
+с кодом 1. Сгенерированные файлы сохраняются в --data-directory и используются повторно
+
+Запуск: python benchmarks/suite.py [--rows 10000 1000000 10000000] [--cases название ...] [--runs N]
+    [--data-directory папка] [--output результаты.json] [--compare прошлые_результаты.json] [--threshold 1.2]
+"""
+import argparse
+import contextlib
+import functools
+import io
+import json
+import os
+import pathlib
+import platform
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+
+import task_5_2
+from make_vacancies import generate
+from statistics_core import make_sinks
+from vacancies_cache import ColumnarCache
+from vacancy_statistics import DataSet
+
+name_vacancy = 'Программист'
+name_vacancies = ['Программист', 'Аналитик', 'Java разработчик', 'Тестировщик', 'Менеджер проектов']
+
+
+def prepare_processing(name_file, directory, filtering_parameter='', sorting_parameter='', is_reverse='',
+                       output_range='', index=True):
+    """Загружает таблицу вакансий и готовит обработку запроса task_5_2 (вывод таблицы в консоль подавляется)
+
+    Args:
+        name_file (str): Имя файла
+        directory (str): Временная папка замера
+        filtering_parameter (str): Параметр фильтрации
+        sorting_parameter (str): Параметр сортировки
+        is_reverse (str): Порядок сортировки
+        output_range (str): Диапазон вывода
+        index (bool): Фильтровать по индексам (иначе - перебором строк)
+
+    Returns:
+        function: обработка запроса
+    """
+    data_set = task_5_2.DataSet(name_file)
+    input_inf = task_5_2.InputConect((name_file, filtering_parameter, sorting_parameter, is_reverse, output_range,
+                                      ''))
+
+    def process():
+        with contextlib.redirect_stdout(io.StringIO()):
+            input_inf.data_processing(data_set.vacancies_table, data_set.vacancies_index if index else None)
+
+    return process
+
+
+def prepare_reading(name_file, directory):
+    """Готовит чтение и очистку строк task_5_2.DataSet.csv_filer
+
+    Args:
+        name_file (str): Имя файла
+        directory (str): Временная папка замера
+
+    Returns:
+        function: чтение файла
+    """
+    return lambda: sum(1 for _ in task_5_2.DataSet.csv_filer(name_file))
+
+
+def prepare_table(name_file, directory):
+    """Готовит загрузку таблицы вакансий и индексов task_5_2.DataSet
+
+    Args:
+        name_file (str): Имя файла
+        directory (str): Временная папка замера
+
+    Returns:
+        function: загрузка таблицы
+    """
+    return lambda: task_5_2.DataSet(name_file)
+
+
+def prepare_encoding(name_file, directory):
+    """Готовит построение колоночных данных в памяти (ColumnarCache.encode)
+
+    Args:
+        name_file (str): Имя файла
+        directory (str): Временная папка замера
+
+    Returns:
+        function: построение колоночных данных
+    """
+    return lambda: ColumnarCache.encode(DataSet(name_file, '').csv_reader())
+
+
+def prepare_streaming(name_file, directory):
+    """Готовит подсчет статистики при потоковом чтении файла (без колоночного кэша)
+
+    Args:
+        name_file (str): Имя файла
+        directory (str): Временная папка замера
+
+    Returns:
+        function: подсчет статистики
+    """
+    data_set = DataSet(name_file, name_vacancy)
+    return lambda: data_set.make_result(*data_set.accumulate(data_set.csv_reader()))
+
+
+def prepare_parallel(name_file, directory):
+    """Готовит подсчет статистики в нескольких процессах
+
+    Args:
+        name_file (str): Имя файла
+        directory (str): Временная папка замера
+
+    Returns:
+        function: подсчет статистики
+    """
+    return DataSet(name_file, name_vacancy).make_statistic_parallel
+
+
+def prepare_vectorized(name_file, directory):
+    """Готовит подсчет статистики векторными операциями по колоночным данным, построенным в памяти
+
+    Args:
+        name_file (str): Имя файла
+        directory (str): Временная папка замера
+
+    Returns:
+        function: подсчет статистики
+    """
+    data_set = DataSet(name_file, name_vacancy)
+    columns = ColumnarCache.encode(data_set.csv_reader())
+    return lambda: data_set.make_statistics([name_vacancy], columns)[name_vacancy]
+
+
+def prepare_professions(name_file, directory):
+    """Готовит подсчет статистики сразу по нескольким профессиям по колоночным данным, построенным в памяти
+
+    Args:
+        name_file (str): Имя файла
+        directory (str): Временная папка замера
+
+    Returns:
+        function: подсчет статистики
+    """
+    data_set = DataSet(name_file, '')
+    columns = ColumnarCache.encode(data_set.csv_reader())
+    return lambda: data_set.make_statistics(name_vacancies, columns)
+
+
+def prepare_sink(name_file, directory, sink):
+    """Подсчитывает статистику и готовит модуль вывода (см. statistics_core.make_sinks). Файлы отчета
+    записываются во временную папку замера. Для pdf изображение формируется при подготовке
+
+    Args:
+        name_file (str): Имя файла
+        directory (str): Временная папка замера
+        sink (str): Модуль вывода
+
+    Returns:
+        function: вывод статистики
+    """
+    data_set = DataSet(name_file, name_vacancy)
+    statistic = data_set.make_statistics([name_vacancy], data_set.load_columns())[name_vacancy]
+    sinks = make_sinks(name_vacancy, statistic, directory)
+    if sink == 'pdf':
+        sinks['image']()
+    return sinks[sink]
+
+
+filter_region = 'Название региона: Москва И Опыт работы: От 1 года до 3 лет'
+cases = {'csv_filer': ('ingestion', prepare_reading),
+         'vacancy_table': ('ingestion', prepare_table),
+         'columnar_encode': ('ingestion', prepare_encoding),
+         'make_statistic': ('statistics', prepare_streaming),
+         'make_statistic_parallel': ('statistics', prepare_parallel),
+         'make_statistic_vectorized': ('statistics', prepare_vectorized),
+         'make_statistics': ('statistics', prepare_professions),
+         'sort_salary': ('sorting', functools.partial(prepare_processing, sorting_parameter='Оклад',
+                                                      is_reverse='Да', output_range='1 100')),
+         'sort_multi_key': ('sorting', functools.partial(prepare_processing,
+                                                         sorting_parameter='Опыт работы, Дата публикации вакансии',
+                                                         is_reverse='Да, Нет', output_range='1 100')),
+         'filter_index': ('filtering', functools.partial(prepare_processing, filtering_parameter=filter_region,
+                                                         output_range='1 100')),
+         'filter_scan': ('filtering', functools.partial(prepare_processing, filtering_parameter=filter_region,
+                                                        output_range='1 100', index=False)),
+         'filter_salary_range': ('filtering', functools.partial(
+             prepare_processing, filtering_parameter='Оклад: 100000-150000 ИЛИ Навыки: Python',
+             output_range='1 100')),
+         'print_table': ('table', functools.partial(prepare_processing, output_range='1 1000')),
+         'console': ('sinks', functools.partial(prepare_sink, sink='console')),
+         'excel': ('sinks', functools.partial(prepare_sink, sink='excel')),
+         'image': ('sinks', functools.partial(prepare_sink, sink='image')),
+         'pdf': ('sinks', functools.partial(prepare_sink, sink='pdf'))}
+
+
+def run_case(case, name_file, runs):
+    """Выполняет замер в текущем процессе
+
+    Args:
+        case (str): Название замера (ключ cases)
+        name_file (str): Имя файла
+        runs (int): Количество запусков
+
+    Returns:
+        dict: медиана времени в секундах и пиковый RSS процесса в мегабайтах
+    """
+    directory = tempfile.mkdtemp()
+    try:
+        function = cases[case][1](name_file, directory)
+        timings = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            function()
+            timings.append(time.perf_counter() - start)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    return {'seconds': statistics.median(timings),
+            'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024}
+
+
+def measure(case, name_file, runs, timeout=None):
+    """Выполняет замер в отдельном процессе
+
+    Args:
+        case (str): Название замера (ключ cases)
+        name_file (str): Имя файла
+        runs (int): Количество запусков
+        timeout (float): Ограничение времени процесса в секундах
+
+    Returns:
+        dict: результат замера (см. run_case) или описание ошибки (ключ error)
+    """
+    try:
+        process = subprocess.run([sys.executable, __file__, '--case', case, '--file', name_file, '--runs', str(runs)],
+                                 capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return {'error': 'превышено время {0} с'.format(timeout)}
+    if process.returncode != 0 or not process.stdout.strip():
+        lines = (process.stderr or process.stdout).strip().splitlines()
+        return {'error': lines[-1] if lines else 'код завершения {0}'.format(process.returncode)}
+    return json.loads(process.stdout.strip().splitlines()[-1])
+
+
+def prepare_file(directory, rows_count, seed):
+    """Находит или генерирует синтетический файл (набор столбцов vacancies)
+
+    Args:
+        directory (Path): Папка сгенерированных файлов
+        rows_count (int): Количество строк
+        seed (int): Зерно генератора
+
+    Returns:
+        str: имя файла
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / 'vacancies_{0}_{1}.csv'.format(rows_count, seed)
+    if not path.exists():
+        print('Генерация {0} ({1} строк)...'.format(path, rows_count))
+        temporary_path = path.with_name(path.name + '.tmp')
+        generate(str(temporary_path), rows_count, seed=seed)
+        os.replace(temporary_path, path)
+    return str(path)
+
+
+def compare(results, name_file, threshold):
+    """Сравнивает результаты с прошлыми
+
+    Args:
+        results (list): Результаты замеров
+        name_file (str): Файл прошлых результатов
+        threshold (float): Допустимое отношение времени к прошлому
+
+    Returns:
+        int: количество замедлившихся замеров
+    """
+    with open(name_file, encoding='utf-8') as file:
+        baseline = {(result['rows'], result['case']): result for result in json.load(file)['results']}
+    slower = 0
+    for result in results:
+        previous = baseline.get((result['rows'], result['case']))
+        if previous is None or 'seconds' not in previous or 'seconds' not in result:
+            continue
+        ratio = result['seconds'] / previous['seconds'] if previous['seconds'] else 1.0
+        mark = ''
+        if ratio > threshold:
+            slower += 1
+            mark = ' - замедление'
+        print('{0} ({1} строк): {2:.3f} с -> {3:.3f} с (x{4:.2f}){5}'.format(
+            result['case'], result['rows'], previous['seconds'], result['seconds'], ratio, mark))
+    return slower
+
+
+def parse_arguments():
+    """Разбирает аргументы командной строки
+
+    Returns:
+        Namespace: разобранные аргументы
+    """
+    parser = argparse.ArgumentParser(description='Набор замеров на синтетических данных')
+    parser.add_argument('--rows', nargs='+', type=int, default=[10000, 1000000, 10000000],
+                        help='Количество строк файлов')
+    parser.add_argument('--cases', nargs='+', choices=list(cases), default=list(cases), help='Замеры')
+    parser.add_argument('--runs', type=int, default=3, help='Количество запусков каждого замера')
+    parser.add_argument('--seed', type=int, default=0, help='Зерно генератора данных')
+    parser.add_argument('--timeout', type=float, help='Ограничение времени одного замера в секундах')
+    parser.add_argument('--data-directory', default=str(pathlib.Path(tempfile.gettempdir()) / 'vacancies_benchmark'),
+                        help='Папка сгенерированных файлов')
+    parser.add_argument('--output', default='benchmark_{0}.json'.format(time.strftime('%Y%m%d-%H%M%S')),
+                        help='Файл результатов')
+    parser.add_argument('--compare', help='Файл прошлых результатов для сравнения')
+    parser.add_argument('--threshold', type=float, default=1.2,
+                        help='Допустимое отношение времени к прошлому результату')
+    parser.add_argument('--case', help=argparse.SUPPRESS)
+    parser.add_argument('--file', help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    arguments = parse_arguments()
+    if arguments.case is not None:
+        print(json.dumps(run_case(arguments.case, arguments.file, arguments.runs)))
+        sys.exit()
+
+    results = []
+    for rows_count in arguments.rows:
+        name_file = prepare_file(pathlib.Path(arguments.data_directory), rows_count, arguments.seed)
+        for case in arguments.cases:
+            result = {'rows': rows_count, 'group': cases[case][0], 'case': case,
+                      **measure(case, name_file, arguments.runs, arguments.timeout)}
+            results.append(result)
+            if 'error' in result:
+                print('{0} ({1} строк): ошибка: {2}'.format(case, rows_count, result['error']))
+            else:
+                print('{0} ({1} строк): {2:.3f} с, пиковый RSS {3:.1f} МБ'.format(case, rows_count, result['seconds'],
+                                                                                 result['peak_rss_mb']))
+    with open(arguments.output, mode='w', encoding='utf-8') as file:
+        json.dump({'created': time.strftime('%Y-%m-%dT%H:%M:%S'), 'python': platform.python_version(),
+                   'platform': platform.platform(), 'cpu_count': os.cpu_count(), 'runs': arguments.runs,
+                   'seed': arguments.seed, 'results': results}, file, ensure_ascii=False, indent=2)
+    print('Результаты записаны в {0}'.format(arguments.output))
+    if arguments.compare is not None and compare(results, arguments.compare, arguments.threshold):
+        sys.exit(1)
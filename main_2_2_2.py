@@ -1,10 +1,216 @@
-import task_5_2
-import task_2_1_3
-
-inp = input("Введите вид обработки данных: (Вакансии или Статистика) - изменение в develop")
-if inp == "Статистика":
-    task_2_1_3.get_result()
-elif inp == "Вакансии":
-    task_5_2.get_result()
-else:
-    print("Неверно введена команда!")
+import argparse
+import json
+import sys
+
+
+def parse_arguments(argv=None):
+    """Разбирает аргументы командной строки
+
+    Args:
+        argv (list): Аргументы командной строки (по умолчанию - sys.argv[1:])
+
+    Returns:
+        Namespace: разобранные аргументы
+    """
+    parser = argparse.ArgumentParser(description='Обработка данных о вакансиях. Без аргументов параметры '
+                                                 'запрашиваются у пользователя')
+    parser.add_argument('mode', nargs='?', choices=['Статистика', 'Вакансии'], help='Вид обработки данных')
+    parser.add_argument('--file', help='Название файла')
+    parser.add_argument('--profession', nargs='+',
+                        help='Название профессии или несколько названий, статистика по которым собирается '
+                             'за один проход (Статистика)')
+    parser.add_argument('--no-report', action='store_true',
+                        help='Не формировать файлы отчета, только вывести статистику (Статистика)')
+    parser.add_argument('--sinks', nargs='+', choices=['console', 'excel', 'image', 'pdf'],
+                        help='Модули вывода статистики: console - консоль, excel - report.xlsx, '
+                             'image - graph.png, pdf - report.pdf (по умолчанию - все) (Статистика)')
+    parser.add_argument('--pdf-backend', choices=['native', 'wkhtmltopdf'], default='native',
+                        help='Модуль вывода pdf: native - без внешних программ, wkhtmltopdf - через шаблон '
+                             'pdf_template.html (Статистика)')
+    parser.add_argument('--output-dir', default='reports', help='Папка файлов отчета (Статистика)')
+    parser.add_argument('--output-template', default='{profession}/{file}',
+                        help='Шаблон пути файла отчета в папке --output-dir с полями {profession}, {run} и {file}, '
+                             'например "{run}/{profession}/{file}" (Статистика)')
+    parser.add_argument('--state',
+                        help='Файл накопленной статистики: файлы из --file и --ingest добавляются к нему, '
+                             'отчеты строятся по нему (Статистика)')
+    parser.add_argument('--ingest', nargs='+', default=[], help='Новые файлы для добавления к --state (Статистика)')
+    parser.add_argument('--filter', default='', help='Параметр фильтрации (Вакансии)')
+    parser.add_argument('--sort', default='', help='Параметр сортировки (Вакансии)')
+    parser.add_argument('--reverse', default='', help='Обратный порядок сортировки: Да / Нет (Вакансии)')
+    parser.add_argument('--range', default='', help='Диапазон вывода, например "10 20" (Вакансии)')
+    parser.add_argument('--columns', default='', help='Требуемые столбцы через ", " (Вакансии)')
+    parser.add_argument('--jobs', help='JSON-файл со списком заданий для пакетной обработки')
+    return parser.parse_args(argv)
+
+
+def read_jobs(name_file):
+    """Читает файл заданий. Файл содержит JSON-список заданий, каждое задание - словарь с ключами
+    mode (Статистика или Вакансии), file и параметрами обработки: profession (название или список названий),
+    no_report, sinks, pdf_backend, output_dir и output_template для статистики,
+    filter, sort, reverse, range и columns для вакансий (значения как при вводе с клавиатуры)
+
+    Args:
+        name_file (str): Имя файла заданий
+
+    Returns:
+        list: список заданий
+    """
+    with open(name_file, encoding='utf-8') as file:
+        jobs = json.load(file)
+    for job in jobs:
+        if job.get('mode') not in ('Статистика', 'Вакансии') or 'file' not in job:
+            print('Неверно задано задание: {0}'.format(job))
+            exit()
+    return jobs
+
+
+def run_isolated(function, numbers, failed):
+    """Выполняет часть пакетной обработки. Модули обработки при ошибке выводят сообщение и завершают
+    программу (exit()), поэтому SystemExit перехватывается, как и прочие ошибки (нет файла, неверное значение
+    в условии фильтра и т.п., их текст выводится): задания этой части отмечаются невыполненными,
+    а остальные задания пакета выполняются дальше
+
+    Args:
+        function (function): Функция без аргументов
+        numbers (list): Номера заданий, к которым относится эта часть
+        failed (list): Номера невыполненных заданий (дополняется при ошибке)
+
+    Returns:
+        tuple: True и результат функции или False и None при ошибке
+    """
+    try:
+        return True, function()
+    except (SystemExit, Exception) as error:
+        if not isinstance(error, SystemExit):
+            print('Ошибка: {0}'.format(error))
+        for number in numbers:
+            print('Задание {0} не выполнено'.format(number))
+        failed.extend(numbers)
+        return False, None
+
+
+def run_jobs(jobs):
+    """Выполняет задания. Задания группируются по файлам, каждый файл загружается один раз для всех заданий
+    статистики и один раз для всех заданий вывода вакансий. Статистика по профессиям всех заданий файла
+    собирается за один проход. Все задания используют один идентификатор запуска ({run} в шаблоне имени файла).
+    Ошибка в задании (или при загрузке файла) не останавливает остальные задания (см. run_isolated)
+
+    Args:
+        jobs (list): Список заданий (см. read_jobs)
+
+    Returns:
+        list: номера невыполненных заданий (задания нумеруются с 1 в порядке файла заданий)
+    """
+    import task_5_2
+    import vacancy_statistics
+
+    run = vacancy_statistics.OutputSpec().run
+    files = {}
+    failed = []
+    for number, job in enumerate(jobs, 1):
+        files.setdefault((job['mode'], job['file']), []).append((number, job))
+    for (mode, name_file), file_jobs in files.items():
+        numbers = [number for number, _ in file_jobs]
+        if mode == 'Статистика':
+            name_vacancies = {}
+            for _, job in file_jobs:
+                job_name_vacancies = job.get('profession', '')
+                if isinstance(job_name_vacancies, str):
+                    job_name_vacancies = [job_name_vacancies]
+                job['profession'] = job_name_vacancies
+                name_vacancies.update(dict.fromkeys(job_name_vacancies))
+            data_set = vacancy_statistics.DataSet(name_file, '')
+            loaded, statistics = run_isolated(
+                lambda: data_set.make_statistics(list(name_vacancies), data_set.load_columns()), numbers, failed)
+            if not loaded:
+                continue
+            for number, job in file_jobs:
+                output_spec = vacancy_statistics.OutputSpec(job.get('output_dir', 'reports'),
+                                                            job.get('output_template', '{profession}/{file}'),
+                                                            run=run)
+                run_isolated(lambda: vacancy_statistics.InputConnect.output(
+                    {name_vacancy: statistics[name_vacancy] for name_vacancy in job['profession']},
+                    not job.get('no_report', False), job.get('pdf_backend', 'native'), output_spec,
+                    job.get('sinks')), [number], failed)
+        else:
+            loaded, data_set = run_isolated(lambda: task_5_2.DataSet(name_file), numbers, failed)
+            if not loaded:
+                continue
+            for number, job in file_jobs:
+                run_isolated(lambda: task_5_2.InputConect((name_file, job.get('filter', ''), job.get('sort', ''),
+                                                           job.get('reverse', ''), job.get('range', ''),
+                                                           job.get('columns', ''))).data_processing(
+                    data_set.vacancies_table, data_set.vacancies_index), [number], failed)
+    return failed
+
+
+def run_state(arguments):
+    """Добавляет новые файлы к накопленной статистике и выводит статистику по ней
+
+    Args:
+        arguments (Namespace): Аргументы командной строки
+    """
+    import vacancy_statistics
+
+    name_vacancies = arguments.profession or [input('Введите название профессии: ')]
+    state = vacancy_statistics.StatisticsState.load(arguments.state)
+    state.add_professions(name_vacancies)
+    for name_file in ([arguments.file] if arguments.file is not None else []) + arguments.ingest:
+        state.ingest(name_file)
+    state.save()
+    vacancy_statistics.InputConnect.output({name_vacancy: state.make_statistic(name_vacancy)
+                                            for name_vacancy in dict.fromkeys(name_vacancies)},
+                                           not arguments.no_report, arguments.pdf_backend,
+                                           vacancy_statistics.OutputSpec(arguments.output_dir,
+                                                                         arguments.output_template),
+                                           arguments.sinks)
+
+
+def main(argv=None):
+    """Запускает программу: пакетную обработку, обработку по аргументам командной строки
+    или, если аргументы не заданы, с вводом параметров пользователем.
+    Модуль выбранного вида обработки импортируется только после выбора, поэтому вывод вакансий
+    не загружает NumPy и модули статистики
+
+    Args:
+        argv (list): Аргументы командной строки (по умолчанию - sys.argv[1:])
+    """
+    arguments = parse_arguments(argv)
+    if arguments.jobs is not None:
+        jobs = read_jobs(arguments.jobs)
+        failed = run_jobs(jobs)
+        if failed:
+            print('Не выполнено заданий: {0} из {1} ({2})'.format(len(failed), len(jobs),
+                                                                ', '.join(map(str, sorted(failed)))))
+        return
+    inp = arguments.mode
+    if inp is None:
+        inp = input("Введите вид обработки данных: (Вакансии или Статистика) - изменение в develop")
+    if inp == "Статистика" and arguments.state is not None:
+        run_state(arguments)
+    elif inp == "Статистика":
+        import vacancy_statistics
+
+        name_vacancy = arguments.profession
+        if name_vacancy is not None and len(name_vacancy) == 1:
+            name_vacancy = name_vacancy[0]
+        vacancy_statistics.InputConnect(arguments.file, name_vacancy, is_report=not arguments.no_report,
+                                        pdf_backend=arguments.pdf_backend,
+                                        output_spec=vacancy_statistics.OutputSpec(arguments.output_dir,
+                                                                                  arguments.output_template),
+                                        sinks=arguments.sinks)
+    elif inp == "Вакансии":
+        import task_5_2
+
+        if arguments.file is None:
+            task_5_2.get_result()
+        else:
+            task_5_2.get_result((arguments.file, arguments.filter, arguments.sort, arguments.reverse,
+                                 arguments.range, arguments.columns))
+    else:
+        print("Неверно введена команда!")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -1,7 +1,13 @@
 import csv
+import heapq
+import operator
 import re
+import sys
+from array import array
+from functools import lru_cache
+from itertools import chain, islice
 from prettytable import PrettyTable, ALL
-from datetime import datetime
+from datetime import date, datetime
 
 
 class InputConect:
@@ -12,34 +18,38 @@ class InputConect:
          file_name (str): Имя файла
          filtering_parameter (str): Параметр фильтрации
          sorting_parameter (str): Параметр сортировки
-         is_reverse_sort_order (bool): булевая переменная определяющая порядок сортировки (обратный или нет)
+         is_reverse_sort_order (bool or list): порядок сортировки (обратный или нет), общий или для каждого
+          параметра сортировки
          output_range (list): диапазон вывода
          required_columns (list): требуемые столбцы
+         field_names (list): столбцы выводимой таблицы
     """
 
-    def __init__(self):
-        """Инициализирует объект InputConect
+    field_names = ['Название', 'Описание', 'Навыки', 'Опыт работы', 'Премиум-вакансия', 'Компания', 'Оклад',
+                   'Название региона', 'Дата публикации вакансии']
+
+    def __init__(self, requests=None):
+        """Инициализирует объект InputConect. Если запросы не переданы, они вводятся пользователем
 
         Args:
-            file_name (str): Имя файла
-            filtering_parameter (str): Параметр фильтрации
-            sorting_parameter (str): Параметр сортировки
-            is_reverse_sort_order (bool): булевая переменная определяющая порядок сортировки (обратный или нет)
-            required_columns (list): требуемые столбцы
+            requests (tuple): Запросы в том виде, в котором их вводит пользователь (имя файла, параметр фильтрации,
+             параметр сортировки, порядок сортировки, диапазон вывода, требуемые столбцы)
         """
-        self.file_name, self.filtering_parameter, self.sorting_parameter, self.is_reverse_sort_order, self.output_range, self.required_columns = InputConect.entering_requests()
+        if requests is None:
+            requests = InputConect.entering_requests()
+        self.file_name, self.filtering_parameter, self.sorting_parameter, self.is_reverse_sort_order, self.output_range, self.required_columns = InputConect.parse_requests(
+            *requests)
 
     @staticmethod
-    def sort_experience(vacancy):
+    def sort_experience(experience):
         """Отвечает за сортировку по параметру Опыт работы. Это метод будет использован как аргумент для Sort.
 
         Args:
-            vacancy (Vacancy): Объект класса Vacancy, содержащий информацию о вакансии
+            experience (str): Идентификатор опыта работы вакансии
 
         Returns:
             int: возвращает цифру равную максимальному числу лет, которое нужно отработать
         """
-        experience = vacancy.experience_id
         if experience == 'noExperience':
             return 0
         elif experience == 'between1And3':
@@ -53,8 +63,8 @@ class InputConect:
         """Отвечает за ввод запросов пользователя
 
         Returns:
-            tuple: коллекция, содержащая параметры введенные пользователем (имя файла, параметр сортировки,
-             параметр фильтрации, порядок сортировки, диапазон вывода и требуемые столбцы)
+            tuple: коллекция строк, введенных пользователем (имя файла, параметр фильтрации,
+             параметр сортировки, порядок сортировки, диапазон вывода и требуемые столбцы)
         """
         print('Введите название файла:', end=' ')
         name_file = input()
@@ -65,74 +75,101 @@ class InputConect:
         print('Обратный порядок сортировки (Да / Нет):', end=' ')
         is_reverse = input()
         print('Введите диапазон вывода:', end=' ')
-        serial_numbers_vacancies = input().split()
+        output_range = input()
         print('Введите требуемые столбцы:', end=' ')
         column_headers_str = input()
-        if is_reverse == 'Да':
-            is_reverse = True
-        elif is_reverse == '' or is_reverse == 'Нет':
-            is_reverse = False
-        else:
+        return name_file, filtering_parameter, sorting_parameter, is_reverse, output_range, column_headers_str
+
+    @staticmethod
+    def parse_requests(name_file, filtering_parameter, sorting_parameter, is_reverse, output_range,
+                       column_headers_str):
+        """Проверяет запросы и приводит их к виду, с которым работает программа
+
+        Args:
+            name_file (str): Имя файла
+            filtering_parameter (str): Параметр фильтрации
+            sorting_parameter (str): Параметр сортировки
+            is_reverse (str): Порядок сортировки (Да / Нет), общий или для каждого параметра сортировки
+            output_range (str): Диапазон вывода
+            column_headers_str (str): Требуемые столбцы
+
+        Returns:
+            tuple: коллекция, содержащая параметры (имя файла, параметр фильтрации, параметр сортировки,
+             порядок сортировки, диапазон вывода и требуемые столбцы)
+        """
+        serial_numbers_vacancies = output_range.split()
+        directions = []
+        for direction in is_reverse.split(', '):
+            if direction == 'Да':
+                directions.append(True)
+            elif direction == '' or direction == 'Нет':
+                directions.append(False)
+            else:
+                print('Порядок сортировки задан некорректно')
+                exit()
+        sorting_parameters = sorting_parameter.split(', ') if sorting_parameter != '' else []
+        if len(directions) != 1 and len(directions) != len(sorting_parameters):
             print('Порядок сортировки задан некорректно')
             exit()
+        is_reverse = directions[0] if len(directions) == 1 else directions
 
         if column_headers_str != "":
             column_headers = column_headers_str.split(', ')
         else:
             column_headers = []
-        all_parameters = ['Навыки', 'Оклад', 'Дата публикации вакансии', 'Опыт работы',
-                          'Премиум-вакансия', 'Идентификатор валюты оклада', 'Описание',
-                          'Название', 'Название региона', 'Компания']
-        if sorting_parameter != '' and sorting_parameter not in all_parameters:
+        all_parameters = FilterExpression.columns
+        if any(parameter not in all_parameters for parameter in sorting_parameters):
             print('Параметр сортировки некорректен')
             exit()
-        if ': ' not in filtering_parameter and '' != filtering_parameter:
-            print('Формат ввода некорректен')
-            exit()
-        elif filtering_parameter.split(': ')[0] not in all_parameters \
-                and '' != filtering_parameter:
-            print('Параметр поиска некорректен')
-            exit()
+        for condition in FilterExpression.split_conditions(filtering_parameter):
+            if ': ' not in condition:
+                print('Формат ввода некорректен')
+                exit()
+            elif condition.split(': ')[0] not in all_parameters:
+                print('Параметр поиска некорректен')
+                exit()
         return name_file, filtering_parameter, sorting_parameter, is_reverse, serial_numbers_vacancies, column_headers
 
     @staticmethod
-    def print_table(vacancies, output_range, required_columns):
-        """Отвечает за формирование и печать таблицы
+    def get_page_bounds(output_range):
+        """Переводит диапазон вывода, введенный пользователем, в границы среза списка вакансий
 
         Args:
-            vacancies (list): Список словарей, содержащих информацию о вакансиях (столбец - значение)
-            output_range (list): Диапазон вывода таблицы
-            required_columns (list): Требуемые для вывода столбцы
+            output_range (list): Диапазон вывода таблицы (номер первой и номер следующей за последней строки)
 
-        Никаких значений не возвращает, но печатает таблицу в консоль
+        Returns:
+            tuple: начало и конец среза (None - до конца списка)
         """
-        table = PrettyTable(hrules=ALL, align='l')
-        flag = True
-        counter = 0
-        for vacancy in vacancies:
-            if flag:
-                table.field_names = vacancy.keys()
-                table.max_width = 20
-                flag = False
-            table.add_row(InputConect.trim_line(vacancy).values())
-            counter += 1
-        if counter == 0:
-            print('Ничего не найдено')
-            exit()
-        range_length = len(output_range)
         start = 0
-        end = counter
-        if range_length == 1:
+        end = None
+        if len(output_range) == 1:
             start = int(output_range[0]) - 1
-        elif range_length == 2:
+        elif len(output_range) == 2:
             start = int(output_range[0]) - 1
             end = int(output_range[1]) - 1
-        table.add_autoindex('№')
+        return start, end
+
+    @staticmethod
+    def print_table(vacancies, numbers, required_columns):
+        """Отвечает за формирование и печать таблицы
+
+        Args:
+            vacancies (list): Список словарей, содержащих информацию о вакансиях выводимой страницы (столбец - значение)
+            numbers (range): Порядковые номера вакансий страницы среди всех найденных вакансий
+            required_columns (list): Требуемые для вывода столбцы
+
+        Никаких значений не возвращает, но печатает таблицу в консоль
+        """
+        table = PrettyTable(hrules=ALL, align='l')
+        table.field_names = ['№'] + InputConect.field_names
+        table.max_width = 20
+        for number, vacancy in zip(numbers, vacancies):
+            table.add_row([number + 1] + list(InputConect.trim_line(vacancy).values()))
         if len(required_columns) != 0:
             required_columns.insert(0, "№")
-            table = table.get_string(start=start, end=end, fields=required_columns)
+            table = table.get_string(fields=required_columns)
         else:
-            table = table.get_string(start=start, end=end)
+            table = table.get_string()
         print(table)
 
     @staticmethod
@@ -152,39 +189,45 @@ class InputConect:
             resultVacancy[key] = val
         return resultVacancy
 
-    def data_processing(self, vacancies):
-        """Обрабатывает данные (вызывает методы сортировки, фильтрации и форматирования)
-
-        Args:
-            vacancies (list): список объектов Vacancy, содержащих информацию о вакансиях
-        """
-        dic_sorting = {'Навыки': lambda vacancy: len(vacancy.key_skills.split('\n')),
-                       'Оклад': lambda vacancy: (float(vacancy.salary.salary_from) * currency_to_rub[
-                           vacancy.salary.salary_currency] + float(
-                           vacancy.salary.salary_to) * currency_to_rub[vacancy.salary.salary_currency]) / 2,
-                       'Дата публикации вакансии': lambda vacancy: vacancy.published_at,
-                       'Опыт работы': self.sort_experience,
-                       'Премиум-вакансия': lambda vacancy: vacancy.premium,
-                       'Описание': lambda vacancy: vacancy.description,
-                       'Название': lambda vacancy: vacancy.name,
-                       'Название региона': lambda vacancy: vacancy.area_name,
-                       'Компания': lambda vacancy: vacancy.employer_name}
-        filter_dictionary = {'Навыки': self.check_occurrence_skills,
-                             'Оклад': lambda sample, vacancy: int(vacancy.salary.salary_from) <= int(sample) <= int(
-                                 vacancy.salary.salary_to),
-                             'Дата публикации вакансии': lambda sample, vacancy: sample == datetime.strptime(
-                                 vacancy.published_at, '%Y-%m-%dT%H:%M:%S%z').strftime('%d.%m.%Y'),
-                             'Опыт работы': lambda sample, vacancy: sample == vacancy.experience_id,
-                             'Премиум-вакансия': lambda sample, vacancy: sample == vacancy.premium,
+    def data_processing(self, vacancies, index=None):
+        """Обрабатывает данные (вызывает методы сортировки, фильтрации и форматирования).
+        Вакансии обрабатываются по номерам строк таблицы, объекты для отдельных вакансий не создаются.
+        Сначала выполняется ленивая фильтрация, затем сортировка: если задан конец диапазона вывода,
+        выбираются только первые вакансии до конца диапазона. Форматируются только выводимые вакансии.
+        Если вакансии переданы потоком, в таблице сохраняются только прошедшие фильтр вакансии,
+        а без сортировки файл читается только до конца диапазона вывода
+
+        Args:
+            vacancies (VacancyTable or iterable): таблица вакансий или поток словарей с информацией о вакансиях
+            index (VacancyIndex): индексы таблицы вакансий (если есть, фильтрация выполняется по ним)
+        """
+        table = vacancies if isinstance(vacancies, VacancyTable) else VacancyTable()
+        dic_sorting = {'Навыки': table.skills_count.__getitem__,
+                       'Оклад': table.salary_rub.__getitem__,
+                       'Дата публикации вакансии': table.published_timestamp.__getitem__,
+                       'Опыт работы': table.experience_rank.__getitem__,
+                       'Премиум-вакансия': table.premium.__getitem__,
+                       'Описание': table.description.__getitem__,
+                       'Название': table.name.__getitem__,
+                       'Название региона': table.area_name.__getitem__,
+                       'Компания': table.employer_name.__getitem__}
+        filter_dictionary = {'Навыки': lambda sample, row: self.check_occurrence_skills(sample, table.key_skills[row]),
+                             'Оклад': lambda sample, row: int(float(table.salary_from[row])) <= int(sample) <= int(
+                                 float(table.salary_to[row])),
+                             'Оклад_range': lambda sample, row: sample[0] <= int(float(table.salary_to[row])) and int(
+                                 float(table.salary_from[row])) <= sample[1],
+                             'Дата публикации вакансии': lambda sample, row: sample == table.published_day[row],
+                             'Дата публикации вакансии_range': lambda sample, row: sample[0] <= table.published_ordinal[
+                                 row] <= sample[1],
+                             'Опыт работы': lambda sample, row: sample == table.experience_id[row],
+                             'Премиум-вакансия': lambda sample, row: sample == table.premium[row],
                              'Идентификатор валюты оклада': lambda sample,
-                                                                   vacancy: sample == vacancy.salary.salary_currency,
-                             'Описание': lambda sample, vacancy: sample == vacancy.description,
-                             'Название': lambda sample, vacancy: sample == vacancy.name,
-                             'Название региона': lambda sample, vacancy: sample == vacancy.area_name,
-                             'Компания': lambda sample, vacancy: sample == vacancy.employer_name}
-        dic_functions = {'Дата публикации вакансии_value': lambda date:
-        datetime.strptime(date, '%Y-%m-%dT%H:%M:%S%z').strftime('%d.%m.%Y'),
-                         'True': lambda elem: dic_naming[elem], 'False': lambda elem: dic_naming[elem],
+                                                                   row: sample == table.salary_currency[row],
+                             'Описание': lambda sample, row: sample == table.description[row],
+                             'Название': lambda sample, row: sample == table.name[row],
+                             'Название региона': lambda sample, row: sample == table.area_name[row],
+                             'Компания': lambda sample, row: sample == table.employer_name[row]}
+        dic_functions = {'True': lambda elem: dic_naming[elem], 'False': lambda elem: dic_naming[elem],
                          'noExperience': lambda elem: dic_naming[elem],
                          'between1And3': lambda elem: dic_naming[elem], 'between3And6': lambda elem: dic_naming[elem],
                          'moreThan6': lambda elem: dic_naming[elem],
@@ -206,36 +249,56 @@ class InputConect:
                       'Рубли': 'RUR', 'Гривны': 'UAH', 'Доллары': 'USD',
                       'Узбекский сум': 'UZS'
                       }
+        start, end = InputConect.get_page_bounds(self.output_range)
+        limit = max(end, 1) if end is not None and start >= 0 else None
+        if table is vacancies:
+            rows = None
+            if self.filtering_parameter != '' and index is not None:
+                rows = FilterExpression(self.filtering_parameter, rus_to_eng).find(index)
+            if rows is None:
+                rows = range(len(table))
+                if self.filtering_parameter != '':
+                    rows = InputConect.make_filtering(rows, self.filtering_parameter, filter_dictionary, rus_to_eng)
+        else:
+            predicate = None
+            if self.filtering_parameter != '':
+                predicate = InputConect.make_predicate(self.filtering_parameter, filter_dictionary, rus_to_eng)
+            rows = table.stream(vacancies, predicate)
         if self.sorting_parameter != '':
-            vacancies = InputConect.make_sort(vacancies, self.sorting_parameter, self.is_reverse_sort_order,
-                                              dic_sorting)
-        if self.filtering_parameter != '':
-            vacancies = InputConect.make_filtering(vacancies, self.filtering_parameter, filter_dictionary, rus_to_eng)
-        vacancies = InputConect.formatter(vacancies, dic_functions)
-        InputConect.print_table(vacancies, self.output_range, self.required_columns)
+            rows = InputConect.make_sort(rows, self.sorting_parameter, self.is_reverse_sort_order, dic_sorting,
+                                         limit)
+        rows = list(islice(rows, limit))
+        if len(rows) == 0:
+            print('Ничего не найдено')
+            exit()
+        numbers = range(len(rows))[start:end]
+        vacancies = InputConect.formatter(table, rows[start:end], dic_functions)
+        InputConect.print_table(vacancies, numbers, self.required_columns)
 
     @staticmethod
-    def formatter(vacancies, funcs):
+    def formatter(table, rows, funcs):
         """Форматирует информацию (переводит на русский, вызывает методы форматирования даты и зарплаты)
 
         Args:
-            vacancies (list): список объектов Vacancy, содержащих информацию о вакансиях
+            table (VacancyTable): таблица, содержащая информацию о вакансиях
+            rows (list): номера строк таблицы, которые нужно отформатировать
             funcs (dict): словарь функций, с помощью которого форматируется информация
 
         Returns:
             list: список словарей, содержащих отформатированную информацию о вакансиях
         """
         result = []
-        for vacancy in vacancies:
-            res = {'Название': vacancy.name,
-                   'Описание': vacancy.description,
-                   'Навыки': vacancy.key_skills,
-                   'Опыт работы': vacancy.experience_id,
-                   'Премиум-вакансия': vacancy.premium,
-                   'Компания': vacancy.employer_name,
-                   'Оклад': funcs['Salary_Value'](vacancy.salary),
-                   'Название региона': vacancy.area_name,
-                   'Дата публикации вакансии': vacancy.published_at}
+        for row in rows:
+            res = {'Название': table.name[row],
+                   'Описание': table.description[row],
+                   'Навыки': table.key_skills[row],
+                   'Опыт работы': table.experience_id[row],
+                   'Премиум-вакансия': table.premium[row],
+                   'Компания': table.employer_name[row],
+                   'Оклад': funcs['Salary_Value'](table.salary_from[row], table.salary_to[row],
+                                                  table.salary_gross[row], table.salary_currency[row]),
+                   'Название региона': table.area_name[row],
+                   'Дата публикации вакансии': table.published_day[row]}
             result_dic = {}
             for key, value in res.items():
                 if key + '_value' in funcs.keys():
@@ -247,11 +310,14 @@ class InputConect:
         return result
 
     @staticmethod
-    def salary_formation(salary):
+    def salary_formation(salary_from, salary_to, salary_gross, salary_currency):
         """Форматирует зарплату, формирует строку для столбца Оклад
 
         Args:
-            salary (Salary): Объект класса Salary, содержащий информацию о зарплате
+            salary_from (str): Нижняя граница зарплаты
+            salary_to (str): Верхняя граница зарплаты
+            salary_gross (str): Оклад указан до вычета налогов
+            salary_currency (str): Идентификатор валюты оклада
 
         Returns:
             str: Сформированная строка оклада для таблицы
@@ -260,23 +326,23 @@ class InputConect:
                                'GEL': 'Грузинский лари', 'KGS': 'Киргизский сом', 'KZT': 'Тенге',
                                'RUR': 'Рубли', 'UAH': 'Гривны', 'USD': 'Доллары',
                                'UZS': 'Узбекский сум'}
-        if salary.salary_gross == 'True':
+        if salary_gross == 'True':
             salary_gross = 'Без вычета налогов'
         else:
             salary_gross = 'С вычетом налогов'
-        result = f'{format(int(salary.salary_from.split(".")[0]), ",").replace(",", " ")} - ' \
-                 f'{format(int(salary.salary_to.split(".")[0]), ",").replace(",", " ")} ' \
-                 f'({currency_dictionary[salary.salary_currency]}) ({salary_gross})'
+        result = f'{format(int(salary_from.split(".")[0]), ",").replace(",", " ")} - ' \
+                 f'{format(int(salary_to.split(".")[0]), ",").replace(",", " ")} ' \
+                 f'({currency_dictionary[salary_currency]}) ({salary_gross})'
         return result
 
     @staticmethod
-    def check_occurrence_skills(sample: str, vacancy):
+    def check_occurrence_skills(sample: str, key_skills: str):
         """Метод для фильтрации по навыкам, проверяет вхождение всех навыков из параметра фильтрации
          в полный список навыков вакансии
 
         Args:
             sample (str): Навыки из параметра, которые должны входить в нужную нам вакансию
-            vacancy (Vacancy): вакансия которая проверяется фильтром
+            key_skills (str): навыки вакансии которая проверяется фильтром (через перенос строки)
 
         Returns:
             bool: True - вакансия подходит, False - вакансия не прошла фильтр
@@ -285,57 +351,228 @@ class InputConect:
             sampleList = sample.split(', ')
         else:
             sampleList = [sample]
-        comparedList = vacancy.key_skills.split('\n')
+        comparedList = key_skills.split('\n')
         for skill in sampleList:
             if skill not in comparedList:
                 return False
         return True
 
     @staticmethod
-    def make_filtering(vacancies: list, parameter, filter_dictionary, rus_to_eng):
-        """Отвечает за осуществление фильтрации
+    def make_predicate(parameter, filter_dictionary, rus_to_eng):
+        """Формирует функцию проверки вакансии по параметру фильтрации (см. FilterExpression)
 
         Args:
-            vacancies (list): Список объектов Vacancy, содержащих информацию о вакансиях
-            parameter (list): Список содержащий параметр фильтрации
+            parameter (str): Параметр фильтрации
             filter_dictionary (dict): Словарь функций для фильтрации по каждому из столбцов
             rus_to_eng (dict): Словарь перевода информации на русский язык
 
         Returns:
-            list: Отфильтрованный список вакансий (объектов класса Vacancy)
+            function: функция, принимающая номер строки и возвращающая True, если вакансия прошла фильтр
         """
-        res_vacancies = []
-        parameter = parameter.split(': ')
-        for vacancy in vacancies:
-            if parameter[1] in rus_to_eng.keys():
-                sample = rus_to_eng[parameter[1]]
-            else:
-                sample = parameter[1]
+        return FilterExpression(parameter, rus_to_eng).make_predicate(filter_dictionary)
+
+    @staticmethod
+    def make_filtering(rows, parameter, filter_dictionary, rus_to_eng):
+        """Отвечает за осуществление фильтрации
 
-            if not (filter_dictionary[parameter[0]](sample, vacancy)):
-                continue
-            res_vacancies.append(vacancy)
-        return res_vacancies
+        Args:
+            rows (iterable): Номера строк таблицы вакансий
+            parameter (str): Параметр фильтрации
+            filter_dictionary (dict): Словарь функций для фильтрации по каждому из столбцов
+            rus_to_eng (dict): Словарь перевода информации на русский язык
+
+        Returns:
+            iterator: Номера строк, прошедших фильтр
+        """
+        return filter(InputConect.make_predicate(parameter, filter_dictionary, rus_to_eng), rows)
 
     @staticmethod
-    def make_sort(vacancies: list, parameter, is_reverse, dic_sorting):
-        """Сортирует вакансии
+    def make_sort(rows, parameter, is_reverse, dic_sorting, limit=None):
+        """Сортирует вакансии. Если задан limit, выбирает только limit первых вакансий с помощью кучи,
+        не сортируя остальные. Результат совпадает с началом полностью отсортированного списка.
+        Можно задать несколько параметров сортировки (через запятую), каждый со своим порядком:
+        полный список сортируется устойчивыми сортировками от последнего параметра к первому,
+        а первые limit вакансий выбираются за один проход по составным ключам
 
         Args:
-            vacancies (list): Список объектов Vacancy, содержащих информацию о вакансиях
-            parameter (str): Параметр сортировки
-            is_reverse (bool): Порядок сортировки
-            dic_sorting (dict): Словарь функций для сортировки
+            rows (iterable): Номера строк таблицы вакансий
+            parameter (str or list): Параметр сортировки или несколько параметров через запятую
+            is_reverse (bool or list): Порядок сортировки (общий или для каждого параметра)
+            dic_sorting (dict): Словарь функций для сортировки (по номеру строки)
+            limit (int): Количество первых вакансий, которые нужно получить (None - все)
 
         Returns:
-            list: Отсортированные список вакансий (объектов класса Vacancy)
+            list: Отсортированный список номеров строк
         """
-        if parameter in dic_sorting.keys():
-            vacancies.sort(key=dic_sorting[parameter], reverse=is_reverse)
-        else:
+        parameters = parameter.split(', ') if isinstance(parameter, str) else list(parameter)
+        directions = list(is_reverse) if isinstance(is_reverse, list) else [is_reverse] * len(parameters)
+        if any(parameter not in dic_sorting.keys() for parameter in parameters):
             print('Параметр сортировки некорректен')
             exit()
-        return vacancies
+        if limit is None:
+            rows = list(rows)
+            for parameter, direction in reversed(list(zip(parameters, directions))):
+                rows.sort(key=dic_sorting[parameter], reverse=direction)
+            return rows
+        if len(parameters) == 1:
+            if directions[0]:
+                return heapq.nlargest(limit, rows, key=dic_sorting[parameters[0]])
+            return heapq.nsmallest(limit, rows, key=dic_sorting[parameters[0]])
+        rows = list(rows)
+        keys = InputConect.make_composite_keys(rows, [dic_sorting[parameter] for parameter in parameters],
+                                               directions)
+        return [rows[index] for index in heapq.nsmallest(limit, range(len(rows)), key=keys.__getitem__)]
+
+    @staticmethod
+    def make_composite_keys(rows, key_functions, directions):
+        """Вычисляет составные ключи сортировки, упорядочиваемые по возрастанию. Для обратного порядка числовые
+        ключи меняют знак, а строковые заменяются рангом значения со знаком минус
+
+        Args:
+            rows (list): Номера строк таблицы вакансий
+            key_functions (list): Функции ключей сортировки (по номеру строки)
+            directions (list): Порядок сортировки для каждого ключа (True - обратный)
+
+        Returns:
+            list: составные ключи (кортежи) в порядке строк rows
+        """
+        columns = []
+        for key_function, is_reverse in zip(key_functions, directions):
+            values = list(map(key_function, rows))
+            if is_reverse and values and isinstance(values[0], str):
+                ranks = {value: rank for rank, value in enumerate(sorted(set(values)))}
+                values = map(ranks.__getitem__, values)
+            if is_reverse:
+                values = map(operator.neg, values)
+            columns.append(values)
+        return list(zip(*columns))
+
+
+class FilterExpression:
+    """Класс для представления составного фильтра: условия вида "Столбец: значение", объединенные связками
+    И / ИЛИ (И связывает сильнее). Для окладов и дат публикации можно задать диапазон через дефис:
+    "Оклад: 50000-100000" (диапазон оклада вакансии пересекается с заданным),
+    "Дата публикации вакансии: 01.01.2022-31.03.2022" (границы включаются).
+    Слова И / ИЛИ считаются связками, только если за ними следует начало условия ("Столбец: "),
+    поэтому значения могут их содержать: "Компания: Рога И Копыта".
+
+    Фильтр компилируется в одну функцию проверки, в которой дешевые условия проверяются первыми,
+    а при наличии индексов - в план выборки по индексам, начиная с самых избирательных условий
+
+    Attributes:
+        disjunction (list): Список конъюнкций, каждая - список условий (столбец, значение)
+        columns (list): Столбцы, по которым можно фильтровать
+        condition_costs (dict): Относительная стоимость проверки условия по столбцу
+        disjunction_separator (Pattern): Скомпилированное регулярное выражение для связки ИЛИ
+        conjunction_separator (Pattern): Скомпилированное регулярное выражение для связки И
+    """
+    columns = ['Навыки', 'Оклад', 'Дата публикации вакансии', 'Опыт работы', 'Премиум-вакансия',
+               'Идентификатор валюты оклада', 'Описание', 'Название', 'Название региона', 'Компания']
+    condition_costs = {'Опыт работы': 1, 'Премиум-вакансия': 1, 'Идентификатор валюты оклада': 1,
+                       'Название региона': 1, 'Компания': 1, 'Название': 1, 'Оклад': 2, 'Оклад_range': 2,
+                       'Навыки': 3, 'Описание': 3, 'Дата публикации вакансии': 4,
+                       'Дата публикации вакансии_range': 4}
+    salary_range = re.compile(r'(\d+)\s*-\s*(\d+)')
+    date_range = re.compile(r'(\d{2}\.\d{2}\.\d{4})\s*-\s*(\d{2}\.\d{2}\.\d{4})')
+    disjunction_separator = re.compile(' ИЛИ (?=(?:{0}): )'.format('|'.join(map(re.escape, columns))))
+    conjunction_separator = re.compile(' И (?=(?:{0}): )'.format('|'.join(map(re.escape, columns))))
+
+    def __init__(self, text, rus_to_eng):
+        """Инициализирует объект FilterExpression, разбирает текст фильтра
+
+        Args:
+            text (str): Текст фильтра
+            rus_to_eng (dict): Словарь перевода информации на русский язык
+        """
+        self.disjunction = [[self.parse_condition(condition, rus_to_eng)
+                             for condition in self.conjunction_separator.split(conjunction)]
+                            for conjunction in self.disjunction_separator.split(text)]
+
+    @staticmethod
+    def split_conditions(text):
+        """Разбивает текст фильтра на отдельные условия
+
+        Args:
+            text (str): Текст фильтра
+
+        Returns:
+            list: условия вида "Столбец: значение" (пустой список для пустого фильтра)
+        """
+        if text == '':
+            return []
+        return [condition for conjunction in FilterExpression.disjunction_separator.split(text)
+                for condition in FilterExpression.conjunction_separator.split(conjunction)]
+
+    @staticmethod
+    def parse_condition(condition, rus_to_eng):
+        """Разбирает условие на название столбца и значение. Диапазоны окладов и дат превращаются
+        в условия по столбцам "Оклад_range" и "Дата публикации вакансии_range" со значением (начало, конец)
+
+        Args:
+            condition (str): Условие вида "Столбец: значение"
+            rus_to_eng (dict): Словарь перевода информации на русский язык
+
+        Returns:
+            tuple: название столбца и значение
+        """
+        parameter, sample = condition.split(': ', 1)
+        salary_range = FilterExpression.salary_range.fullmatch(sample)
+        date_range = FilterExpression.date_range.fullmatch(sample)
+        if parameter == 'Оклад' and salary_range:
+            return 'Оклад_range', (int(salary_range[1]), int(salary_range[2]))
+        if parameter == 'Дата публикации вакансии' and date_range:
+            return 'Дата публикации вакансии_range', tuple(datetime.strptime(day, '%d.%m.%Y').toordinal()
+                                                           for day in date_range.groups())
+        return parameter, rus_to_eng.get(sample, sample)
+
+    def make_predicate(self, filter_dictionary):
+        """Компилирует фильтр в одну функцию проверки вакансии. Внутри каждой конъюнкции условия упорядочены
+        по стоимости проверки
+
+        Args:
+            filter_dictionary (dict): Словарь функций для фильтрации по каждому из столбцов
+
+        Returns:
+            function: функция, принимающая номер строки и возвращающая True, если вакансия прошла фильтр
+        """
+        conjunctions = []
+        for conjunction in self.disjunction:
+            conjunction = sorted(conjunction, key=lambda condition: self.condition_costs.get(condition[0], 5))
+            checks = [(filter_dictionary[parameter], sample) for parameter, sample in conjunction]
+            if len(checks) == 1:
+                check, sample = checks[0]
+                conjunctions.append(lambda row, check=check, sample=sample: check(sample, row))
+            else:
+                conjunctions.append(lambda row, checks=checks: all(check(sample, row) for check, sample in checks))
+        if len(conjunctions) == 1:
+            return conjunctions[0]
+        return lambda row: any(conjunction(row) for conjunction in conjunctions)
+
+    def find(self, index):
+        """Выполняет фильтр по индексам: в каждой конъюнкции пересекает списки строк, начиная с самого короткого,
+        затем объединяет результаты конъюнкций
+
+        Args:
+            index (VacancyIndex): Индексы таблицы вакансий
+
+        Returns:
+            list: номера строк в порядке возрастания или None, если какое-то условие не поддерживается индексами
+        """
+        result = set()
+        for conjunction in self.disjunction:
+            postings = [index.find(parameter, sample) for parameter, sample in conjunction]
+            if any(posting is None for posting in postings):
+                return None
+            postings.sort(key=len)
+            rows = set(postings[0])
+            for posting in postings[1:]:
+                if not rows:
+                    break
+                rows.intersection_update(posting)
+            result.update(rows)
+        if len(self.disjunction) == 1:
+            return sorted(rows)
+        return sorted(result)
 
 
 class Vacancy:
@@ -352,6 +589,8 @@ class Vacancy:
         area_name (str): Название региона
         published_at (str): Дата и время публикации вакансии
     """
+    __slots__ = ('name', 'description', 'key_skills', 'experience_id', 'premium', 'employer_name', 'salary',
+                 'area_name', 'published_at')
 
     def __init__(self, name, description, key_skills, experience_id, premium, employer_name, salary, area_name,
                  published_at):
@@ -388,6 +627,7 @@ class Salary:
         salary_gross (str): Оклад указан до вычета налогов
         salary_currency (str): Идентификатор валюты оклада
     """
+    __slots__ = ('salary_from', 'salary_to', 'salary_gross', 'salary_currency')
 
     def __init__(self, salary_from, salary_to, salary_gross, salary_currency):
         """Инициализирует объект Vacancy
@@ -404,82 +644,459 @@ class Salary:
         self.salary_currency = salary_currency
 
 
+class VacancyTable:
+    """Класс для компактного представления набора вакансий: каждый столбец хранится отдельным списком,
+    вакансия задается номером строки. Значения категориальных столбцов интернируются, поэтому одинаковые
+    строки хранятся в памяти один раз
+
+    Для сортировки и фильтрации при добавлении вакансии один раз вычисляются ключи, которые хранятся
+    в типизированных массивах: оклад в рублях, количество навыков, ранг опыта работы, время публикации
+    (в секундах от начала эпохи) и день публикации (номер дня, см. date.toordinal). День публикации
+    в формате дд.мм.гггг хранится отдельным столбцом published_day
+
+    Attributes:
+        columns (tuple): Названия столбцов таблицы
+        categorical_columns (tuple): Столбцы с небольшим количеством различных значений
+        key_columns (dict): Столбцы ключей сортировки и фильтрации и их типы
+    """
+    columns = ('name', 'description', 'key_skills', 'experience_id', 'premium', 'employer_name', 'salary_from',
+               'salary_to', 'salary_gross', 'salary_currency', 'area_name', 'published_at')
+    categorical_columns = ('experience_id', 'premium', 'employer_name', 'salary_gross', 'salary_currency',
+                           'area_name')
+    key_columns = {'salary_rub': 'd', 'skills_count': 'i', 'experience_rank': 'b', 'published_timestamp': 'q',
+                   'published_ordinal': 'i'}
+
+    def __init__(self):
+        """Инициализирует пустой объект VacancyTable
+        """
+        for column in self.columns:
+            setattr(self, column, [])
+        self.published_day = []
+        for column, typecode in self.key_columns.items():
+            setattr(self, column, array(typecode))
+
+    def __len__(self):
+        """Возвращает количество вакансий в таблице
+
+        Returns:
+            int: количество строк
+        """
+        return len(self.name)
+
+    def append(self, dic):
+        """Добавляет вакансию в таблицу
+
+        Args:
+            dic (dict): Информация о вакансии (название колонки - значение)
+        """
+        for column in self.columns:
+            value = dic[column]
+            if column in self.categorical_columns:
+                value = sys.intern(value)
+            getattr(self, column).append(value)
+        rate = currency_to_rub[dic['salary_currency']]
+        self.salary_rub.append((float(dic['salary_from']) * rate + float(dic['salary_to']) * rate) / 2)
+        self.skills_count.append(len(dic['key_skills'].split('\n')))
+        self.experience_rank.append(InputConect.sort_experience(dic['experience_id']))
+        published_day, published_ordinal, published_timestamp = DataSet.parse_published_at(dic['published_at'])
+        self.published_day.append(published_day)
+        self.published_ordinal.append(published_ordinal)
+        self.published_timestamp.append(published_timestamp)
+
+    @classmethod
+    def from_vacancies(cls, vacancies):
+        """Создает таблицу из вакансий
+
+        Args:
+            vacancies (iterable): Словари с информацией о вакансиях (название колонки - значение)
+
+        Returns:
+            VacancyTable: заполненная таблица
+        """
+        table = cls()
+        for dic in vacancies:
+            table.append(dic)
+        return table
+
+    def pop(self):
+        """Удаляет последнюю вакансию из таблицы
+        """
+        for column in self.columns + tuple(self.key_columns) + ('published_day',):
+            getattr(self, column).pop()
+
+    def stream(self, vacancies, predicate=None):
+        """Добавляет вакансии в таблицу по одной и выдает номера их строк. Вакансии, не прошедшие проверку,
+        сразу удаляются из таблицы, поэтому в памяти хранятся только подходящие вакансии
+
+        Args:
+            vacancies (iterable): Словари с информацией о вакансиях (название колонки - значение)
+            predicate (function): Проверка вакансии по номеру строки (None - подходят все вакансии)
+
+        Returns:
+            int: номер строки добавленной вакансии
+            генератор с помощью yield
+        """
+        for dic in vacancies:
+            self.append(dic)
+            row = len(self) - 1
+            if predicate is None or predicate(row):
+                yield row
+            else:
+                self.pop()
+
+    def get_vacancy(self, row):
+        """Создает объект Vacancy для одной строки таблицы
+
+        Args:
+            row (int): Номер строки
+
+        Returns:
+            Vacancy: вакансия
+        """
+        return Vacancy(self.name[row], self.description[row], self.key_skills[row], self.experience_id[row],
+                       self.premium[row], self.employer_name[row],
+                       Salary(self.salary_from[row], self.salary_to[row], self.salary_gross[row],
+                              self.salary_currency[row]),
+                       self.area_name[row], self.published_at[row])
+
+
+class IntervalTree:
+    """Класс для представления статического дерева интервалов: по отрезку находит все интервалы, которые с ним
+    пересекаются, за время, пропорциональное логарифму количества интервалов и количеству найденных интервалов
+
+    Attributes:
+        center (int): Центральная точка узла
+        by_start (list): Интервалы, содержащие центральную точку, по возрастанию начала (начало, конец, номер строки)
+        by_end (list): Те же интервалы по убыванию конца
+        left (IntervalTree): Поддерево интервалов, лежащих левее центральной точки
+        right (IntervalTree): Поддерево интервалов, лежащих правее центральной точки
+    """
+
+    def __init__(self, intervals):
+        """Инициализирует объект IntervalTree
+
+        Args:
+            intervals (list): Непустой список интервалов (начало, конец, номер строки), начало не больше конца.
+                Центральная точка - один из концов интервалов, поэтому в каждом узле остается хотя бы
+                один интервал и построение завершается
+        """
+        points = sorted(point for interval in intervals for point in interval[:2])
+        self.center = points[len(points) // 2]
+        left = [interval for interval in intervals if interval[1] < self.center]
+        right = [interval for interval in intervals if interval[0] > self.center]
+        middle = [interval for interval in intervals if interval[0] <= self.center <= interval[1]]
+        self.by_start = sorted(middle)
+        self.by_end = sorted(middle, key=lambda interval: interval[1], reverse=True)
+        self.left = IntervalTree(left) if left else None
+        self.right = IntervalTree(right) if right else None
+
+    def find(self, low, high):
+        """Находит интервалы, пересекающиеся с отрезком [low, high] (границы включаются).
+        Для поиска интервалов, содержащих точку, low и high совпадают
+
+        Args:
+            low (int): Начало отрезка
+            high (int): Конец отрезка
+
+        Returns:
+            list: номера строк найденных интервалов
+        """
+        rows = []
+        nodes = [self]
+        while nodes:
+            node = nodes.pop()
+            if high < node.center:
+                for start, end, row in node.by_start:
+                    if start > high:
+                        break
+                    rows.append(row)
+                if node.left is not None:
+                    nodes.append(node.left)
+            elif low > node.center:
+                for start, end, row in node.by_end:
+                    if end < low:
+                        break
+                    rows.append(row)
+                if node.right is not None:
+                    nodes.append(node.right)
+            else:
+                rows.extend(row for start, end, row in node.by_start)
+                nodes.extend(child for child in (node.left, node.right) if child is not None)
+        return rows
+
+
+class VacancyIndex:
+    """Класс для представления индексов таблицы вакансий, которые строятся один раз после загрузки файла.
+    Фильтрация по индексу занимает время, пропорциональное количеству найденных вакансий, а не размеру файла
+
+    Attributes:
+        equality_columns (dict): Параметры фильтрации по точному совпадению и соответствующие им столбцы
+        equality (dict): Хэш-индексы по столбцам (столбец - значение - номера строк)
+        skills (dict): Инвертированный индекс навыков (навык - номера строк)
+        dates (dict): Индекс по дню публикации (дд.мм.гггг - номера строк)
+        ordinals (dict): Индекс по номеру дня публикации (см. date.toordinal)
+        salaries (IntervalTree): Дерево интервалов окладов
+        inverted_salaries (list): Оклады, у которых нижняя граница больше верхней (нижняя граница, верхняя
+            граница, номер строки). В дерево они не попадают и проверяются перебором тем же условием, что и без индекса
+    """
+    equality_columns = {'Опыт работы': 'experience_id', 'Премиум-вакансия': 'premium',
+                        'Идентификатор валюты оклада': 'salary_currency', 'Название': 'name',
+                        'Название региона': 'area_name', 'Компания': 'employer_name'}
+
+    def __init__(self, table):
+        """Инициализирует объект VacancyIndex, строит индексы по всем строкам таблицы
+
+        Args:
+            table (VacancyTable): Таблица вакансий
+        """
+        self.equality = {}
+        for column in self.equality_columns.values():
+            self.equality[column] = self.group_rows(getattr(table, column))
+        self.skills = {}
+        for row, key_skills in enumerate(table.key_skills):
+            for skill in set(key_skills.split('\n')):
+                self.skills.setdefault(skill, []).append(row)
+        self.dates = self.group_rows(table.published_day)
+        self.ordinals = self.group_rows(table.published_ordinal)
+        intervals = []
+        self.inverted_salaries = []
+        for row, (salary_from, salary_to) in enumerate(zip(table.salary_from, table.salary_to)):
+            interval = (int(float(salary_from)), int(float(salary_to)), row)
+            if interval[0] <= interval[1]:
+                intervals.append(interval)
+            else:
+                self.inverted_salaries.append(interval)
+        self.salaries = IntervalTree(intervals) if intervals else None
+
+    @staticmethod
+    def group_rows(values):
+        """Группирует номера строк по значениям
+
+        Args:
+            values (iterable): Значения столбца по строкам
+
+        Returns:
+            dict: словарь номеров строк в порядке возрастания (значение - номера строк)
+        """
+        groups = {}
+        for row, value in enumerate(values):
+            groups.setdefault(value, []).append(row)
+        return groups
+
+    def find(self, parameter, sample):
+        """Находит вакансии, прошедшие фильтр, по индексу
+
+        Args:
+            parameter (str): Название столбца фильтрации
+            sample (str or tuple): Значение фильтра (переведенное с помощью rus_to_eng) или диапазон
+
+        Returns:
+            list: номера строк в порядке возрастания или None, если для столбца нет индекса
+        """
+        if parameter in self.equality_columns:
+            return self.equality[self.equality_columns[parameter]].get(sample, [])
+        if parameter == 'Дата публикации вакансии':
+            return self.dates.get(sample, [])
+        if parameter == 'Навыки':
+            postings = sorted((self.skills.get(skill, []) for skill in sample.split(', ')), key=len)
+            rows = set(postings[0])
+            for posting in postings[1:]:
+                rows.intersection_update(posting)
+            return sorted(rows)
+        if parameter == 'Дата публикации вакансии_range':
+            return sorted(row for ordinal, rows in self.ordinals.items()
+                          if sample[0] <= ordinal <= sample[1] for row in rows)
+        if parameter == 'Оклад' or parameter == 'Оклад_range':
+            low, high = (int(sample), int(sample)) if parameter == 'Оклад' else sample
+            rows = self.salaries.find(low, high) if self.salaries else []
+            if parameter == 'Оклад':
+                rows += [row for salary_from, salary_to, row in self.inverted_salaries
+                         if salary_from <= low <= salary_to]
+            else:
+                rows += [row for salary_from, salary_to, row in self.inverted_salaries
+                         if low <= salary_to and salary_from <= high]
+            return sorted(rows)
+        return None
+
+
 class DataSet:
     """Отвечает за чтение и подготовку данных из CSV-файла
 
     Attributes:
         file_name (str): Имя файла
-        vacancies_objects (list): список объектов класса Vacancy, содержащих в себе информацию из файла после парсинга
+        vacancies_table (VacancyTable): таблица вакансий, содержащая информацию из файла после парсинга
+        vacancies_index (VacancyIndex): индексы таблицы вакансий для повторных запросов
+        raw_columns (tuple): Столбцы, которые не очищаются
+        categorical_columns (tuple): Столбцы с небольшим набором часто повторяющихся значений
+        html_tag (Pattern): Скомпилированное регулярное выражение для html тегов
+        epoch (int): Номер дня начала эпохи (см. date.toordinal)
     """
+    raw_columns = ('key_skills',)
+    categorical_columns = ('premium', 'salary_currency', 'experience_id', 'salary_gross', 'area_name')
+    html_tag = re.compile(r'<[^>]*>')
+    epoch = date(1970, 1, 1).toordinal()
 
     def __init__(self, file_name):
-        """Инициализирует объект DataSet, звпускает работу остальных методов для заполнения vacancies_objects
+        """Инициализирует объект DataSet, звпускает работу остальных методов для заполнения vacancies_table
 
         Args:
             file_name (str): Имя файла
         """
         self.file_name = file_name
-        self.vacancies_objects = DataSet.csv_filer(file_name)
+        self.vacancies_table = VacancyTable.from_vacancies(DataSet.csv_filer(file_name))
+        self.vacancies_index = VacancyIndex(self.vacancies_table)
 
     @staticmethod
     def csv_reader(name_file):
-        """Отвечает за открывание и считывание csv файла
+        """Отвечает за открывание и считывание csv файла. Заголовки и первая строка читаются сразу,
+        чтобы проверить, что файл не пустой, остальные строки читаются по мере необходимости
 
         Args:
             name_file (str): Имя файла
 
         Returns:
-            tuple: Коллекция из двух элементов: первый - список заголовков, второй - список строк информации из файла
+            tuple: Коллекция из двух элементов: первый - список заголовков, второй - генератор строк информации из файла
         """
         file = open(name_file, encoding='utf_8_sig')
         reader = csv.reader(file)
-        data = []
-        for i in reader:
-            data.append(i)
-        if len(data) == 0:
+        headings = next(reader, None)
+        first_row = next(reader, None)
+        if headings is None:
+            file.close()
             print('Пустой файл')
             exit()
-        elif len(data) == 1:
+        elif first_row is None:
+            file.close()
             print('Нет данных')
             exit()
-        return data[0], data[1:]
+        return headings, DataSet.read_rows(file, chain([first_row], reader))
+
+    @staticmethod
+    def read_rows(file, reader):
+        """Выдает строки файла и закрывает файл после чтения последней строки
+
+        Args:
+            file (TextIOWrapper): Открытый файл
+            reader (iterable): Строки файла в виде списков значений
+
+        Returns:
+            list: строка файла в виде списка значений
+            генератор с помощью yield
+        """
+        with file:
+            yield from reader
 
     @staticmethod
     def csv_filer(name_file):
         """Отвечает за "чистку" считанной информации: убирает html теги, лишние пробелы.
-        Формирует из полученной информации объекты класса Vacancy
+        Строки читаются и очищаются по одной, по мере необходимости
 
         Args:
             name_file(str): Имя файла
 
         Returns:
-            list: список объектов класса Vacancy, содержащих в себе информацию из файла после парсинга
+            dict: словарь с информацией о вакансии после парсинга (название колонки - значение)
+            генератор с помощью yield
         """
         headings, informations = DataSet.csv_reader(name_file)
-        vacancies_objects = []
+        cleaners = [DataSet.get_cleaner(heading) for heading in headings]
         for inf in informations:
-            dic = {}
             if len(headings) == len(inf) and '' not in inf:
-                for i in range(len(inf)):
-                    if headings[i] != 'key_skills':
-                        inf[i] = re.sub(r'<[^>]*>', '', inf[i], flags=re.S)
-                        inf[i] = " ".join(inf[i].split())
-                    dic[headings[i]] = inf[i]
-                vacancies_objects.append(
-                    Vacancy(dic['name'], dic['description'], dic['key_skills'], dic['experience_id'],
-                            dic['premium'], dic['employer_name'],
-                            Salary(dic['salary_from'], dic['salary_to'],
-                                   dic['salary_gross'], dic['salary_currency']),
-                            dic['area_name'], dic['published_at']))
-        return vacancies_objects
-
-
-def get_result():
+                yield {heading: clean(value) for heading, clean, value in zip(headings, cleaners, inf)}
+
+    @staticmethod
+    def get_cleaner(heading):
+        """Выбирает функцию очистки для столбца: навыки не очищаются, значения категориальных столбцов
+        очищаются от html тегов и лишних пробелов и запоминаются в кэше, остальные столбцы (длинный текст,
+        оклады, даты публикации) очищаются так же, но без кэша: их значения почти не повторяются
+
+        Args:
+            heading (str): Заголовок столбца
+
+        Returns:
+            function: функция очистки значения
+        """
+        if heading in DataSet.raw_columns:
+            return str
+        if heading in DataSet.categorical_columns:
+            return DataSet.clean_short_value
+        return DataSet.clean_markup
+
+    @staticmethod
+    def clean_markup(value):
+        """Убирает из значения html теги и лишние пробелы
+
+        Args:
+            value (str): Значение ячейки
+
+        Returns:
+            str: очищенное значение
+        """
+        if '<' in value:
+            value = DataSet.html_tag.sub('', value)
+        return ' '.join(value.split())
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def clean_short_value(value):
+        """Очищает значение категориального столбца (валюта, опыт работы, регион и т.п.). Такие значения часто
+        повторяются, поэтому результат запоминается в ограниченном кэше
+
+        Args:
+            value (str): Значение ячейки
+
+        Returns:
+            str: очищенное значение
+        """
+        return DataSet.clean_markup(value)
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def parse_published_day(day):
+        """Разбирает день публикации вида гггг-мм-дд. Дней в выборке немного по сравнению с количеством
+        вакансий, поэтому результат запоминается в ограниченном кэше
+
+        Args:
+            day (str): Первые 10 символов даты публикации
+
+        Returns:
+            tuple: день в формате дд.мм.гггг, номер дня (см. date.toordinal)
+            и время начала дня в UTC (в секундах от начала эпохи)
+        """
+        ordinal = date(int(day[:4]), int(day[5:7]), int(day[8:10])).toordinal()
+        return sys.intern(day[8:10] + '.' + day[5:7] + '.' + day[:4]), ordinal, (ordinal - DataSet.epoch) * 86400
+
+    @staticmethod
+    def parse_published_at(published_at):
+        """Разбирает дату публикации вида гггг-мм-ддTчч:мм:сс+чччч срезами строки, без strptime.
+        Строки другого вида разбираются с помощью strptime
+
+        Args:
+            published_at (str): Дата и время публикации вакансии
+
+        Returns:
+            tuple: день в формате дд.мм.гггг, номер дня (см. date.toordinal)
+            и время публикации (в секундах от начала эпохи)
+        """
+        if len(published_at) != 24 or published_at[10] != 'T' or published_at[19] not in '+-':
+            published = datetime.strptime(published_at, '%Y-%m-%dT%H:%M:%S%z')
+            return sys.intern(published.strftime('%d.%m.%Y')), published.toordinal(), int(published.timestamp())
+        day, ordinal, day_start = DataSet.parse_published_day(published_at[:10])
+        offset = int(published_at[20:22]) * 3600 + int(published_at[22:24]) * 60
+        if published_at[19] == '-':
+            offset = -offset
+        return day, ordinal, day_start + int(published_at[11:13]) * 3600 + int(published_at[14:16]) * 60 + int(
+            published_at[17:19]) - offset
+
+
+def get_result(requests=None):
     """Запускает программу
+
+    Args:
+        requests (tuple): Запросы пользователя (см. InputConect), по умолчанию вводятся с клавиатуры
     """
-    input_inf = InputConect()
-    data_Set = DataSet(input_inf.file_name)
-    input_inf.data_processing(data_Set.vacancies_objects)
+    input_inf = InputConect(requests)
+    input_inf.data_processing(DataSet.csv_filer(input_inf.file_name))
 
 
 # get_result()
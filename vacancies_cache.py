@@ -0,0 +1,111 @@
+import json
+import os
+import pathlib
+import sys
+from array import array
+
+import numpy as np
+
+
+class ColumnarCache:
+    """Класс отвечающий за колоночный бинарный кэш очищенных данных CSV-файла с вакансиями.
+
+    Кэш хранится в папке <имя файла>.cache рядом с CSV-файлом: числовые столбцы записываются типизированными
+    массивами NumPy (.npy), строковые столбцы (название, регион, валюта) - кодами в словаре значений,
+    сами словари - в vocabularies.json. Массивы загружаются через отображение файла в память.
+
+    Attributes:
+        name_file (str): Имя CSV-файла
+        directory (Path): Папка кэша
+        numeric_columns (dict): Числовые столбцы и их типы
+        encoded_columns (dict): Строковые столбцы, хранящиеся кодами, и типы кодов
+    """
+    numeric_columns = {'salary_from': 'q', 'salary_to': 'q', 'year': 'h'}
+    encoded_columns = {'salary_currency': 'b', 'name': 'i', 'area_name': 'i'}
+
+    def __init__(self, name_file):
+        """Инициализирует объект ColumnarCache
+
+        Args:
+            name_file (str): Имя CSV-файла
+        """
+        self.name_file = name_file
+        self.directory = pathlib.Path(str(name_file) + '.cache')
+
+    @property
+    def vocabularies_path(self):
+        """Путь к файлу словарей. Он записывается последним, поэтому по нему определяется готовность кэша
+
+        Returns:
+            Path: путь к vocabularies.json
+        """
+        return self.directory / 'vocabularies.json'
+
+    def is_fresh(self):
+        """Проверяет, что кэш существует и создан позже CSV-файла
+
+        Returns:
+            bool: True - кэш можно использовать, False - кэш отсутствует или устарел
+        """
+        return self.vocabularies_path.exists() and \
+            self.vocabularies_path.stat().st_mtime >= os.stat(self.name_file).st_mtime
+
+    @classmethod
+    def encode(cls, vacancies):
+        """Преобразует очищенные данные в колоночное представление в памяти
+
+        Args:
+            vacancies (iterable): Словари с информацией о вакансиях (название колонки - значение),
+                например, результат DataSet.csv_reader
+
+        Returns:
+            tuple: словарь массивов по столбцам (для строковых столбцов - коды)
+            и словарь словарей значений строковых столбцов (столбец - список значений)
+        """
+        columns = {column: array(typecode) for column, typecode in
+                   {**cls.numeric_columns, **cls.encoded_columns}.items()}
+        vocabularies = {column: {} for column in cls.encoded_columns}
+        for vacancy in vacancies:
+            columns['salary_from'].append(int(float(vacancy['salary_from'])))
+            columns['salary_to'].append(int(float(vacancy['salary_to'])))
+            columns['year'].append(int(vacancy['published_at'][:4]))
+            for column, vocabulary in vocabularies.items():
+                columns[column].append(vocabulary.setdefault(vacancy[column], len(vocabulary)))
+        return ({column: np.frombuffer(values, dtype=values.typecode) for column, values in columns.items()},
+                {column: list(vocabulary) for column, vocabulary in vocabularies.items()})
+
+    def build(self, vacancies):
+        """Записывает кэш по очищенным данным
+
+        Args:
+            vacancies (iterable): Словари с информацией о вакансиях (название колонки - значение),
+                например, результат DataSet.csv_reader
+        """
+        columns, vocabularies = self.encode(vacancies)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if self.vocabularies_path.exists():
+            self.vocabularies_path.unlink()
+        for column, values in columns.items():
+            np.save(self.directory / '{0}.npy'.format(column), values)
+        with open(self.vocabularies_path, mode='w', encoding='utf-8') as file:
+            json.dump(vocabularies, file, ensure_ascii=False)
+
+    def load(self):
+        """Загружает кэш, массивы отображаются в память без чтения файла целиком
+
+        Returns:
+            tuple: словарь массивов по столбцам (для строковых столбцов - коды)
+            и словарь словарей значений строковых столбцов (столбец - список значений)
+        """
+        columns = {column: np.load(self.directory / '{0}.npy'.format(column), mmap_mode='r')
+                   for column in {**self.numeric_columns, **self.encoded_columns}}
+        with open(self.vocabularies_path, encoding='utf-8') as file:
+            vocabularies = json.load(file)
+        return columns, vocabularies
+
+
+if __name__ == '__main__':
+    from vacancy_statistics import DataSet
+
+    for name_file in sys.argv[1:]:
+        ColumnarCache(name_file).build(DataSet(name_file, '').csv_reader())
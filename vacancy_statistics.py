@@ -0,0 +1,1757 @@
+import csv
+import hashlib
+import json
+import os
+import re
+import shutil
+import time
+import tempfile
+from collections import deque
+from contextlib import ExitStack, contextmanager
+from functools import lru_cache
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import numpy as np
+import pathlib
+from vacancies_cache import ColumnarCache
+
+
+class Vacancy:
+    """
+    Класс для представления вакансии
+
+    Attributes:
+        name (str): Название вакансии
+        area_name (str): Название региона
+        year (int): Год публикации вакансии
+        salary_to (int): Нижняя граница зарплат
+        salary_from (int): Верхняя граница зарплат
+        salary_currency (str): Идентификатор валюты оклада
+        salary_average_value (float): Средняя зарплата
+        currency_to_rub (dict): Словарь курса валют
+    """
+    currency_to_rub = {
+        "RUR": 1,
+        "BYR": 23.91,
+        "KZT": 0.13,
+        "EUR": 59.90,
+        "KGS": 0.76,
+        "GEL": 21.74,
+        "UZS": 0.0055,
+        "UAH": 1.64,
+        "USD": 60.66,
+        "AZN": 35.68
+    }
+
+    def __init__(self, vacancy):
+        """
+        Инициализирует объект Vacancy, выполняет конвертацию для целочисленных полей
+
+        Args:
+            vacancy (dict): Информация об одной вакансии полученная из файла в виде словаря
+        """
+        self.name = vacancy['name']
+        self.area_name = vacancy['area_name']
+        self.year = int(vacancy['published_at'][:4])
+        self.salary_to = int(float(vacancy['salary_to']))
+        self.salary_from = int(float(vacancy['salary_from']))
+        self.salary_currency = vacancy['salary_currency']
+        self.salary_average_value = self.currency_to_rub[self.salary_currency] * (self.salary_from + self.salary_to) / 2
+
+
+class Accumulator:
+    """Класс для потокового накопления статистики: по каждому ключу (год, город) хранит сумму и количество
+    значений, а не список самих значений.
+
+    Суммы хранятся целыми числами с фиксированной точкой (шаг 2 ** -64), поэтому сложение точное и не зависит
+    от порядка: накопители, собранные по разным частям файла, объединяются без потери точности.
+
+    Attributes:
+        sums (dict): Суммы значений по ключам в единицах 2 ** -64
+        counts (dict): Количество значений по ключам
+    """
+    scale = 2.0 ** 64
+
+    def __init__(self):
+        """Инициализирует пустой объект Accumulator
+        """
+        self.sums = {}
+        self.counts = {}
+
+    def add(self, key, value):
+        """Добавляет значение к статистике ключа
+
+        Args:
+            key (int or str): Ключ (год или город)
+            value (float): Значение (средняя зарплата вакансии)
+        """
+        if key in self.counts:
+            self.sums[key] += int(value * self.scale)
+            self.counts[key] += 1
+        else:
+            self.sums[key] = int(value * self.scale)
+            self.counts[key] = 1
+
+    def add_total(self, key, total, count):
+        """Добавляет к статистике ключа уже просуммированные значения
+
+        Args:
+            key (int or str): Ключ (год или город)
+            total (int): Сумма значений в единицах 2 ** -64
+            count (int): Количество значений
+        """
+        if key in self.counts:
+            self.sums[key] += total
+            self.counts[key] += count
+        else:
+            self.sums[key] = total
+            self.counts[key] = count
+
+    def merge(self, other):
+        """Объединяет накопитель с другим накопителем. Новые ключи добавляются в порядке их появления в other
+
+        Args:
+            other (Accumulator): Накопитель, собранный по другой части данных
+
+        Returns:
+            Accumulator: текущий накопитель
+        """
+        for key, count in other.counts.items():
+            self.add_total(key, other.sums[key], count)
+        return self
+
+    @classmethod
+    def from_arrays(cls, keys, values, labels=None, block_size=1 << 16):
+        """Создает накопитель по массивам ключей и значений с помощью группировки NumPy.
+        Результат совпадает с накопителем, заполненным методом add в порядке следования элементов:
+        значения раскладываются на целую часть и два 32-битных разряда дробной части, которые суммируются
+        блоками без потери точности
+
+        Args:
+            keys (ndarray): Массив ключей (или кодов ключей)
+            values (ndarray): Массив неотрицательных значений
+            labels (list): Значения ключей по кодам (если keys - коды)
+            block_size (int): Количество элементов в блоке суммирования
+
+        Returns:
+            Accumulator: заполненный накопитель
+        """
+        accumulator = cls()
+        if len(keys) == 0:
+            return accumulator
+        unique_keys, first_indexes, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        integer_part = np.floor(values)
+        fraction = (values - integer_part) * 2.0 ** 32
+        high_part = np.floor(fraction)
+        low_part = np.floor((fraction - high_part) * 2.0 ** 32)
+        sums = []
+        for part in (integer_part, high_part, low_part):
+            part_sums = np.zeros(len(unique_keys), dtype=np.int64)
+            for start in range(0, len(part), block_size):
+                part_sums += np.bincount(inverse[start:start + block_size], weights=part[start:start + block_size],
+                                         minlength=len(unique_keys)).astype(np.int64)
+            sums.append(part_sums.tolist())
+        counts = np.bincount(inverse, minlength=len(unique_keys)).tolist()
+        for index in np.argsort(first_indexes, kind='stable').tolist():
+            key = unique_keys[index].item()
+            if labels is not None:
+                key = labels[key]
+            accumulator.sums[key] = (sums[0][index] << 64) + (sums[1][index] << 32) + sums[2][index]
+            accumulator.counts[key] = counts[index]
+        return accumulator
+
+    def average(self):
+        """Вычисляет средние значения по ключам
+
+        Returns:
+            dict: словарь средних значений (ключ - целая часть среднего)
+        """
+        return {key: int(self.sums[key] / int(self.scale) / count) for key, count in self.counts.items()}
+
+    def count(self):
+        """Возвращает количество значений по ключам
+
+        Returns:
+            dict: словарь количества значений (ключ - количество)
+        """
+        return dict(self.counts)
+
+    def to_list(self):
+        """Преобразует накопитель в список для записи в JSON (ключи-числа сохраняют свой тип)
+
+        Returns:
+            list: список [ключ, сумма, количество] в порядке ключей
+        """
+        return [[key, self.sums[key], count] for key, count in self.counts.items()]
+
+    @classmethod
+    def from_list(cls, items):
+        """Создает накопитель по списку, полученному методом to_list
+
+        Args:
+            items (list): Список [ключ, сумма, количество]
+
+        Returns:
+            Accumulator: накопитель
+        """
+        accumulator = cls()
+        for key, total, count in items:
+            accumulator.add_total(key, total, count)
+        return accumulator
+
+
+class ProfessionMatcher:
+    """Класс для поиска вхождений нескольких названий профессий в название вакансии за один проход
+    по строке (алгоритм Ахо - Корасик). Время поиска зависит от длины названия вакансии и количества найденных
+    профессий, но не от общего количества профессий
+
+    Attributes:
+        transitions (list): Переходы бора по символам для каждого состояния
+        failures (list): Суффиксные ссылки состояний
+        outputs (list): Номера профессий, найденных при переходе в состояние
+        always (list): Номера пустых названий профессий, которые входят в любое название
+    """
+
+    def __init__(self, name_vacancies):
+        """Инициализирует объект ProfessionMatcher, строит бор и суффиксные ссылки
+
+        Args:
+            name_vacancies (list): Названия профессий
+        """
+        self.transitions = [{}]
+        self.failures = [0]
+        self.outputs = [[]]
+        self.always = [index for index, name_vacancy in enumerate(name_vacancies) if name_vacancy == '']
+        for index, name_vacancy in enumerate(name_vacancies):
+            state = 0
+            for char in name_vacancy:
+                if char not in self.transitions[state]:
+                    self.transitions[state][char] = len(self.transitions)
+                    self.transitions.append({})
+                    self.failures.append(0)
+                    self.outputs.append([])
+                state = self.transitions[state][char]
+            if name_vacancy != '':
+                self.outputs[state].append(index)
+        states = deque(self.transitions[0].values())
+        while states:
+            state = states.popleft()
+            for char, next_state in self.transitions[state].items():
+                states.append(next_state)
+                failure = self.failures[state]
+                while failure and char not in self.transitions[failure]:
+                    failure = self.failures[failure]
+                self.failures[next_state] = self.transitions[failure].get(char, 0)
+                self.outputs[next_state] = self.outputs[next_state] + self.outputs[self.failures[next_state]]
+
+    def find(self, name):
+        """Находит профессии, названия которых входят в название вакансии
+
+        Args:
+            name (str): Название вакансии
+
+        Returns:
+            set: номера найденных профессий
+        """
+        found = set(self.always)
+        state = 0
+        for char in name:
+            while state and char not in self.transitions[state]:
+                state = self.failures[state]
+            state = self.transitions[state].get(char, 0)
+            found.update(self.outputs[state])
+        return found
+
+
+class DataSet:
+    """Класс отвечающий за чтение и подготовку данных из CSV-файла
+
+    Attributes:
+        name_file (str): Имя файла
+        name_vacancy (str): Название профессии по которой собирается статистика
+    """
+
+    def __init__(self, name_file, name_vacancy):
+        """Инициализирует объект DataSet
+
+        Args:
+            name_file (str): Имя файла
+            name_vacancy (str): Название профессии по которой собирается статистика
+        """
+        self.name_file = name_file
+        self.name_vacancy = name_vacancy
+
+    def csv_reader(self):
+        """Парсит файл и формирует из вакансий словари (название колонки - значение)
+
+        Returns:
+            dict: Словари с информацией о вакансиях
+            генератор с помощью yield
+
+        """
+        with open(self.name_file, mode='r', encoding='utf-8-sig') as file:
+            reader = csv.reader(file)
+            headings = next(reader)
+            yield from self.rows_to_dicts(headings, reader)
+
+    @staticmethod
+    def rows_to_dicts(headings, reader):
+        """Отбрасывает неполные строки и формирует из остальных словари (название колонки - значение)
+
+        Args:
+            headings (list): Заголовки столбцов
+            reader (iterable): Строки файла в виде списков значений
+
+        Returns:
+            dict: Словари с информацией о вакансиях
+            генератор с помощью yield
+        """
+        for inf in reader:
+            if len(headings) == len(inf) and '' not in inf:
+                yield dict(zip(headings, inf))
+
+    def split_file(self, chunks_count, block_size=1 << 20):
+        """Разбивает файл на диапазоны байтов, границы которых совпадают с началом записей CSV.
+        Значения в кавычках могут содержать переносы строк (описания вакансий), поэтому файл просматривается
+        блоками с подсчетом кавычек: перенос строки считается концом записи, только если до него
+        четное количество кавычек (экранированная кавычка "" не меняет четность)
+
+        Args:
+            chunks_count (int): Желаемое количество диапазонов
+            block_size (int): Размер блока просмотра в байтах
+
+        Returns:
+            tuple: заголовки столбцов и список диапазонов (начало, конец) в байтах
+        """
+        with open(self.name_file, mode='rb') as file:
+            headings = next(csv.reader([file.readline().decode('utf-8-sig')]))
+            start = file.tell()
+            file_size = os.fstat(file.fileno()).st_size
+            chunk_size = max((file_size - start) // chunks_count, 1)
+            bounds = [start]
+            position, offset, quotes, block = start, 0, 0, b''
+            target = start + chunk_size
+            while target < file_size:
+                index = target - position
+                if index >= len(block):
+                    quotes += block.count(b'"', offset)
+                    position += len(block)
+                    block, offset = file.read(block_size), 0
+                    if not block:
+                        break
+                    continue
+                quotes += block.count(b'"', offset, index)
+                newline = block.find(b'\n', index)
+                if newline == -1:
+                    offset, target = index, position + len(block)
+                    continue
+                quotes += block.count(b'"', index, newline)
+                offset = newline + 1
+                if quotes % 2 == 0:
+                    bounds.append(position + offset)
+                target = position + offset + (0 if quotes % 2 else chunk_size)
+            if bounds[-1] < file_size:
+                bounds.append(file_size)
+        return headings, list(zip(bounds, bounds[1:]))
+
+    @staticmethod
+    def read_chunk(name_file, start, end):
+        """Читает строки файла из диапазона байтов
+
+        Args:
+            name_file (str): Имя файла
+            start (int): Начало диапазона (начало записи)
+            end (int): Конец диапазона (начало записи или конец файла)
+
+        Returns:
+            str: Строки файла
+            генератор с помощью yield
+        """
+        with open(name_file, mode='rb') as file:
+            file.seek(start)
+            position = start
+            while position < end:
+                line = file.readline()
+                if not line:
+                    break
+                position += len(line)
+                yield line.decode('utf-8')
+
+    def make_statistic_parallel(self, processes=None):
+        """Формирует статистические данные в нескольких процессах. Файл делится на диапазоны,
+        для каждого диапазона в отдельном процессе собираются накопители, затем они объединяются в порядке
+        следования диапазонов. Результат совпадает с make_statistic
+
+        Args:
+            processes (int): Количество процессов (по умолчанию - количество ядер)
+
+        Returns:
+            tuple: кортеж из 6 словарей содержащих в себе статистику по годам или городам
+        """
+        processes = processes or os.cpu_count()
+        headings, chunks = self.split_file(processes * 4)
+        wages, vacancy_wages, city_wages = Accumulator(), Accumulator(), Accumulator()
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            futures = [executor.submit(accumulate_chunk, self.name_file, self.name_vacancy, headings, start, end)
+                       for start, end in chunks]
+            for future in futures:
+                chunk_wages, chunk_vacancy_wages, chunk_city_wages = future.result()
+                wages.merge(chunk_wages)
+                vacancy_wages.merge(chunk_vacancy_wages)
+                city_wages.merge(chunk_city_wages)
+        return self.make_result(wages, vacancy_wages, city_wages)
+
+    def split_by_years(self, directory):
+        """Разбивает файл на файлы по годам публикации вакансий (<год>.csv в заданной папке).
+        Неполные строки отбрасываются, в каждый файл записывается строка заголовков.
+        Файлы по годам, оставшиеся в папке от прошлого разбиения, удаляются: иначе год, которого больше нет
+        в исходном файле, попал бы в статистику (см. find_partitions)
+
+        Args:
+            directory (str): Папка для файлов по годам
+
+        Returns:
+            dict: словарь путей к файлам (год - путь)
+        """
+        pathlib.Path(directory).mkdir(parents=True, exist_ok=True)
+        for path in self.find_partitions(directory).values():
+            path.unlink()
+        partitions = {}
+        writers = {}
+        with open(self.name_file, mode='r', encoding='utf-8-sig') as file:
+            reader = csv.reader(file)
+            headings = next(reader)
+            published_at = headings.index('published_at')
+            try:
+                for inf in reader:
+                    if len(headings) != len(inf) or '' in inf:
+                        continue
+                    year = int(inf[published_at][:4])
+                    if year not in writers:
+                        partitions[year] = pathlib.Path(directory) / '{0}.csv'.format(year)
+                        partition_file = open(partitions[year], mode='w', encoding='utf-8-sig', newline='')
+                        writers[year] = (partition_file, csv.writer(partition_file))
+                        writers[year][1].writerow(headings)
+                    writers[year][1].writerow(inf)
+            finally:
+                for partition_file, writer in writers.values():
+                    partition_file.close()
+        return dict(sorted(partitions.items()))
+
+    @staticmethod
+    def find_partitions(directory):
+        """Находит файлы по годам, созданные методом split_by_years
+
+        Args:
+            directory (str): Папка с файлами по годам
+
+        Returns:
+            dict: словарь путей к файлам (год - путь) в порядке возрастания годов
+        """
+        return {int(path.stem): path for path in sorted(pathlib.Path(directory).glob('*.csv')) if path.stem.isdigit()}
+
+    def make_statistic_by_years(self, directory, processes=None):
+        """Формирует статистические данные по файлам, созданным методом split_by_years. Файлы обрабатываются
+        одновременно в нескольких процессах, накопители объединяются в порядке возрастания годов.
+        Накопители по годам не сохраняются: при каждом вызове обрабатываются все файлы
+
+        Args:
+            directory (str): Папка с файлами по годам
+            processes (int): Количество процессов (по умолчанию - количество ядер)
+
+        Returns:
+            tuple: кортеж из 6 словарей содержащих в себе статистику по годам или городам
+        """
+        wages, vacancy_wages, city_wages = Accumulator(), Accumulator(), Accumulator()
+        with ProcessPoolExecutor(max_workers=processes or os.cpu_count()) as executor:
+            futures = [executor.submit(accumulate_file, str(path), self.name_vacancy)
+                       for path in self.find_partitions(directory).values()]
+            for future in futures:
+                year_wages, year_vacancy_wages, year_city_wages = future.result()
+                wages.merge(year_wages)
+                vacancy_wages.merge(year_vacancy_wages)
+                city_wages.merge(year_city_wages)
+        return self.make_result(wages, vacancy_wages, city_wages)
+
+    @staticmethod
+    def output_statistics(first_statistical_data, second_statistical_data, third_statistical_data,
+                          fourth_statistical_data,
+                          fifth_statistical_data, sixth_statistical_data):
+        """Выводит готовые статистические данные
+
+        Args:
+            first_statistical_data (dict): Динамика уровня зарплат по годам
+            second_statistical_data (dict): Динамика количества вакансий по годам
+            third_statistical_data (dict): Динамика уровня зарплат по годам для выбранной профессии
+            fourth_statistical_data (dict): Динамика количества вакансий по годам для выбранной профессии
+            fifth_statistical_data (dict): Уровень зарплат по городам (в порядке убывания)
+            sixth_statistical_data (dict): Доля вакансий по городам (в порядке убывания)
+        """
+        print('Динамика уровня зарплат по годам: {0}'.format(first_statistical_data))
+        print('Динамика количества вакансий по годам: {0}'.format(second_statistical_data))
+        print('Динамика уровня зарплат по годам для выбранной профессии: {0}'.format(third_statistical_data))
+        print('Динамика количества вакансий по годам для выбранной профессии: {0}'.format(fourth_statistical_data))
+        print('Уровень зарплат по городам (в порядке убывания): {0}'.format(fifth_statistical_data))
+        print('Доля вакансий по городам (в порядке убывания): {0}'.format(sixth_statistical_data))
+
+    def accumulate(self, all_vacancies):
+        """Собирает накопители статистики по вакансиям за один проход для выбранной профессии
+        (см. accumulate_professions)
+
+        Args:
+            all_vacancies (iterable): Словари с информацией о вакансиях (название колонки - значение)
+
+        Returns:
+            tuple: накопители зарплат по годам, по годам для выбранной профессии и по городам
+        """
+        wages, vacancy_wages, city_wages = self.accumulate_professions(all_vacancies, [self.name_vacancy])
+        return wages, vacancy_wages[0], city_wages
+
+    def load_columns(self):
+        """Загружает данные в колоночном представлении: из актуального кэша (см. ColumnarCache),
+        а если его нет - из CSV-файла
+
+        Returns:
+            tuple: словарь массивов по столбцам и словарь словарей значений строковых столбцов
+        """
+        cache = ColumnarCache(self.name_file)
+        if cache.is_fresh():
+            return cache.load()
+        return ColumnarCache.encode(self.csv_reader())
+
+    @staticmethod
+    def average_salaries(columns, vocabularies):
+        """Вычисляет средние зарплаты вакансий в рублях по колоночным данным
+
+        Args:
+            columns (dict): Массивы по столбцам
+            vocabularies (dict): Словари значений строковых столбцов
+
+        Returns:
+            ndarray: средние зарплаты вакансий
+        """
+        rates = np.array([Vacancy.currency_to_rub[currency] for currency in vocabularies['salary_currency']],
+                         dtype=np.float64)
+        salary_sum = np.asarray(columns['salary_from']) + np.asarray(columns['salary_to'])
+        return rates[columns['salary_currency']] * salary_sum / 2
+
+    @staticmethod
+    def accumulate_professions(all_vacancies, name_vacancies):
+        """Собирает накопители статистики сразу для нескольких профессий за один проход. Профессии, входящие
+        в название вакансии, находятся с помощью ProfessionMatcher один раз для каждого различного названия
+
+        Args:
+            all_vacancies (iterable): Словари с информацией о вакансиях (название колонки - значение)
+            name_vacancies (list): Названия профессий
+
+        Returns:
+            tuple: накопитель зарплат по годам, список накопителей зарплат по годам для каждой профессии
+            и накопитель зарплат по городам
+        """
+        matcher = ProfessionMatcher(name_vacancies)
+        matches = {}
+        wages = Accumulator()
+        vacancy_wages = [Accumulator() for _ in name_vacancies]
+        city_wages = Accumulator()
+        for vacancy_dict in all_vacancies:
+            vacancy = Vacancy(vacancy_dict)
+            wages.add(vacancy.year, vacancy.salary_average_value)
+            if vacancy.name not in matches:
+                matches[vacancy.name] = matcher.find(vacancy.name)
+            for index in matches[vacancy.name]:
+                vacancy_wages[index].add(vacancy.year, vacancy.salary_average_value)
+            city_wages.add(vacancy.area_name, vacancy.salary_average_value)
+        return wages, vacancy_wages, city_wages
+
+    @staticmethod
+    def accumulate_professions_vectorized(columns, vocabularies, name_vacancies):
+        """Собирает накопители статистики сразу для нескольких профессий по колоночным данным.
+        Зарплаты один раз группируются по парам (название вакансии, год), затем суммы групп добавляются
+        к накопителям профессий, входящих в название. Время не зависит от количества профессий, умноженного
+        на количество строк
+
+        Args:
+            columns (dict): Массивы по столбцам
+            vocabularies (dict): Словари значений строковых столбцов
+            name_vacancies (list): Названия профессий
+
+        Returns:
+            tuple: накопитель зарплат по годам, список накопителей зарплат по годам для каждой профессии
+            и накопитель зарплат по городам
+        """
+        matcher = ProfessionMatcher(name_vacancies)
+        matches = [matcher.find(name) for name in vocabularies['name']]
+        salary_average_values = DataSet.average_salaries(columns, vocabularies)
+        years = np.asarray(columns['year'], dtype=np.int64)
+        name_years = Accumulator.from_arrays((np.asarray(columns['name'], dtype=np.int64) << 16) | years,
+                                             salary_average_values)
+        vacancy_wages = [Accumulator() for _ in name_vacancies]
+        for key, count in name_years.counts.items():
+            for index in matches[key >> 16]:
+                vacancy_wages[index].add_total(key & 0xFFFF, name_years.sums[key], count)
+        return (Accumulator.from_arrays(years, salary_average_values), vacancy_wages,
+                Accumulator.from_arrays(columns['area_name'], salary_average_values, vocabularies['area_name']))
+
+    def make_statistics(self, name_vacancies, loaded_columns=None):
+        """Формирует статистические данные сразу для нескольких профессий за один проход по данным:
+        по колоночным данным - векторными операциями (см. accumulate_professions_vectorized), иначе - потоково
+        (см. accumulate_professions). Результаты обоих способов совпадают
+
+        Args:
+            name_vacancies (list): Названия профессий
+            loaded_columns (tuple): Уже загруженные данные файла (результат load_columns). Если не заданы,
+                используется актуальный колоночный кэш, а если его нет - файл читается потоково
+
+        Returns:
+            dict: словарь статистики по профессиям (название профессии - кортеж из 6 словарей)
+        """
+        if loaded_columns is None:
+            cache = ColumnarCache(self.name_file)
+            if cache.is_fresh():
+                loaded_columns = cache.load()
+        if loaded_columns is None:
+            wages, vacancy_wages, city_wages = self.accumulate_professions(self.csv_reader(), name_vacancies)
+        else:
+            wages, vacancy_wages, city_wages = self.accumulate_professions_vectorized(*loaded_columns,
+                                                                                       name_vacancies)
+        return {name_vacancy: self.make_result(wages, vacancy_wages[index], city_wages)
+                for index, name_vacancy in enumerate(name_vacancies)}
+
+    @staticmethod
+    def make_result(wages, vacancy_wages, city_wages):
+        """Формирует статистические данные из накопителей
+
+        Args:
+            wages (Accumulator): Зарплаты по годам
+            vacancy_wages (Accumulator): Зарплаты по годам для выбранной профессии
+            city_wages (Accumulator): Зарплаты по городам
+
+        Returns:
+            tuple: кортеж из 6 словарей содержащих в себе статистику по годам или городам
+        """
+        vacancies_count = sum(wages.counts.values())
+        vacancies_num = wages.count()
+        if vacancy_wages.counts:
+            vacancies_num_by_name = vacancy_wages.count()
+            second_statistical_data = vacancy_wages.average()
+        else:
+            vacancies_num_by_name = dict.fromkeys(vacancies_num, 0)
+            second_statistical_data = dict.fromkeys(vacancies_num, 0)
+        third_statistical_data = city_wages.average()
+        statistical_data = wages.average()
+
+        fourth_statistical_data = {}
+        for city, city_count in city_wages.counts.items():
+            fourth_statistical_data[city] = round(city_count / vacancies_count, 4)
+        fourth_statistical_data = list(
+            filter(lambda s: s[-1] >= 0.01, [(key, value) for key, value in fourth_statistical_data.items()]))
+        fourth_statistical_data.sort(key=lambda s: s[-1], reverse=True)
+        fifth_statistical_data = fourth_statistical_data.copy()
+        fourth_statistical_data = dict(fourth_statistical_data)
+        third_statistical_data = list(filter(lambda s: s[0] in fourth_statistical_data,
+                                             [(key, value) for key, value in third_statistical_data.items()]))
+        third_statistical_data.sort(key=lambda s: s[-1], reverse=True)
+        third_statistical_data = dict(third_statistical_data[:10])
+        fifth_statistical_data = dict(fifth_statistical_data[:10])
+
+        return statistical_data, vacancies_num, second_statistical_data, vacancies_num_by_name, third_statistical_data, fifth_statistical_data
+
+    def make_statistic(self):
+        """Формирует статистические данные для выбранной профессии (см. make_statistics).
+        Если для файла есть актуальный колоночный кэш (см. ColumnarCache), статистика считается по нему
+        векторными операциями NumPy. Иначе файл читается потоково. Для каждого ключа хранятся только сумма
+        и количество зарплат, поэтому расход памяти не зависит от количества строк в файле
+
+        Returns:
+            tuple: кортеж из 6 словарей содержащих в себе статистику по годам или городам
+        """
+        return self.make_statistics([self.name_vacancy])[self.name_vacancy]
+
+
+class StatisticsState:
+    """Класс для хранения накопленной статистики между запусками: суммы и количества зарплат по годам, городам
+    и годам для каждой отслеживаемой профессии, а также список обработанных файлов с их размерами
+    и контрольными суммами. Новый файл добавляется к состоянию без повторной обработки уже учтенных файлов,
+    у дописанного файла обрабатываются только новые строки. Статистика для отчетов строится по состоянию
+    за время, пропорциональное количеству различных ключей.
+
+    Состояние хранится в JSON-файле. Предполагается, что значения в файлах не содержат переносов строк
+
+    Attributes:
+        path (Path): Путь к файлу состояния
+        files (dict): Обработанные файлы (путь - словарь с размером обработанной части и ее контрольной суммой)
+        wages (Accumulator): Зарплаты по годам
+        vacancy_wages (dict): Зарплаты по годам для отслеживаемых профессий (название профессии - накопитель)
+        city_wages (Accumulator): Зарплаты по городам
+        version (int): Версия формата файла состояния
+    """
+    version = 1
+
+    def __init__(self, path):
+        """Инициализирует пустой объект StatisticsState
+
+        Args:
+            path (str): Путь к файлу состояния
+        """
+        self.path = pathlib.Path(path)
+        self.files = {}
+        self.wages = Accumulator()
+        self.vacancy_wages = {}
+        self.city_wages = Accumulator()
+
+    @classmethod
+    def load(cls, path):
+        """Загружает состояние из файла. Если файла нет, создается пустое состояние
+
+        Args:
+            path (str): Путь к файлу состояния
+
+        Returns:
+            StatisticsState: состояние
+        """
+        state = cls(path)
+        if not state.path.exists():
+            return state
+        with open(state.path, encoding='utf-8') as file:
+            data = json.load(file)
+        if data.get('version') != cls.version:
+            print('Неподдерживаемая версия файла состояния')
+            exit()
+        state.files = data['files']
+        state.wages = Accumulator.from_list(data['wages'])
+        state.vacancy_wages = {name_vacancy: Accumulator.from_list(items)
+                               for name_vacancy, items in data['vacancy_wages'].items()}
+        state.city_wages = Accumulator.from_list(data['city_wages'])
+        return state
+
+    def save(self):
+        """Записывает состояние в файл. Сначала записывается временный файл, который затем заменяет старый,
+        поэтому при сбое во время записи сохраняется предыдущее состояние
+        """
+        data = {'version': self.version, 'files': self.files, 'wages': self.wages.to_list(),
+                'vacancy_wages': {name_vacancy: accumulator.to_list()
+                                  for name_vacancy, accumulator in self.vacancy_wages.items()},
+                'city_wages': self.city_wages.to_list()}
+        temporary_path = self.path.with_name(self.path.name + '.tmp')
+        with open(temporary_path, mode='w', encoding='utf-8') as file:
+            json.dump(data, file, ensure_ascii=False)
+        os.replace(temporary_path, self.path)
+
+    @staticmethod
+    def checksum(name_file, size):
+        """Вычисляет контрольную сумму (SHA-256) начала файла
+
+        Args:
+            name_file (str): Имя файла
+            size (int): Количество байтов от начала файла
+
+        Returns:
+            str: контрольная сумма в шестнадцатеричном виде
+        """
+        digest = hashlib.sha256()
+        with open(name_file, mode='rb') as file:
+            while size > 0:
+                block = file.read(min(size, 1 << 20))
+                if not block:
+                    break
+                digest.update(block)
+                size -= len(block)
+        return digest.hexdigest()
+
+    @staticmethod
+    def read_rows(name_file, start, end):
+        """Читает вакансии из диапазона байтов файла. Начало диапазона 0 означает начало первой строки
+        после заголовков
+
+        Args:
+            name_file (str): Имя файла
+            start (int): Начало диапазона (начало записи)
+            end (int): Конец диапазона (начало записи или конец файла)
+
+        Returns:
+            dict: Словари с информацией о вакансиях
+            генератор с помощью yield
+        """
+        with open(name_file, mode='rb') as file:
+            headings = next(csv.reader([file.readline().decode('utf-8-sig')]))
+            start = max(start, file.tell())
+        yield from DataSet.rows_to_dicts(headings, csv.reader(DataSet.read_chunk(name_file, start, end)))
+
+    def add_professions(self, name_vacancies):
+        """Начинает отслеживать профессии. Для новых профессий статистика собирается по уже обработанным
+        частям файлов из списка файлов состояния за один проход по каждому файлу
+
+        Args:
+            name_vacancies (list): Названия профессий
+        """
+        new_name_vacancies = [name_vacancy for name_vacancy in dict.fromkeys(name_vacancies)
+                              if name_vacancy not in self.vacancy_wages]
+        if not new_name_vacancies:
+            return
+        accumulators = [Accumulator() for _ in new_name_vacancies]
+        for name_file, processed in self.files.items():
+            if not os.path.exists(name_file) or self.checksum(name_file, processed['size']) != processed['sha256']:
+                print('Файл {0} изменен или удален, статистику по новым профессиям собрать нельзя'.format(name_file))
+                exit()
+            wages, vacancy_wages, city_wages = DataSet.accumulate_professions(
+                self.read_rows(name_file, 0, processed['size']), new_name_vacancies)
+            for accumulator, file_accumulator in zip(accumulators, vacancy_wages):
+                accumulator.merge(file_accumulator)
+        self.vacancy_wages.update(zip(new_name_vacancies, accumulators))
+
+    def ingest(self, name_file):
+        """Добавляет к состоянию вакансии из файла. Если файл уже обработан и не изменился, он пропускается,
+        если в конец файла дописаны строки - обрабатываются только они
+
+        Args:
+            name_file (str): Имя файла
+
+        Returns:
+            bool: True - состояние изменилось, False - файл уже учтен
+        """
+        name_file = str(pathlib.Path(name_file).resolve())
+        size = os.path.getsize(name_file)
+        start = 0
+        if name_file in self.files:
+            processed = self.files[name_file]
+            if size == processed['size'] and self.checksum(name_file, size) == processed['sha256']:
+                return False
+            if size < processed['size'] or self.checksum(name_file, processed['size']) != processed['sha256']:
+                print('Файл {0} изменен не только дописыванием строк, состояние нужно собрать заново'.format(
+                    name_file))
+                exit()
+            start = processed['size']
+        name_vacancies = list(self.vacancy_wages)
+        wages, vacancy_wages, city_wages = DataSet.accumulate_professions(self.read_rows(name_file, start, size),
+                                                                          name_vacancies)
+        self.wages.merge(wages)
+        for name_vacancy, accumulator in zip(name_vacancies, vacancy_wages):
+            self.vacancy_wages[name_vacancy].merge(accumulator)
+        self.city_wages.merge(city_wages)
+        self.files[name_file] = {'size': size, 'sha256': self.checksum(name_file, size)}
+        return True
+
+    def make_statistic(self, name_vacancy):
+        """Формирует статистические данные по состоянию. Результат совпадает с DataSet.make_statistic
+        для всех обработанных файлов, записанных друг за другом
+
+        Args:
+            name_vacancy (str): Название отслеживаемой профессии
+
+        Returns:
+            tuple: кортеж из 6 словарей содержащих в себе статистику по годам или городам
+        """
+        return DataSet.make_result(self.wages, self.vacancy_wages[name_vacancy], self.city_wages)
+
+
+class InputConnect:
+    """Класс отвечающий за обработку параметров вводимых пользователем, а также за
+    запуск работы других классов и формирования статистики.
+    Статистика выводится модулями вывода (sinks): console - вывод в консоль (DataSet.output_statistics),
+    остальные - файлы отчета, формируемые этапами Report.stages
+
+    Attributes:
+        name_file (str): Имя файла
+        name_vacancy (str or list): Название профессии по которой собирается статистика или список названий
+        sinks (tuple): Модули вывода по умолчанию
+    """
+    sinks = ('console', 'excel', 'image', 'pdf')
+
+    def __init__(self, name_file=None, name_vacancy=None, loaded_columns=None, is_report=True,
+                 pdf_backend='native', output_spec=None, sinks=None):
+        """Принимает параметры вводимые пользователем (название файла и название профессии),
+        запускает работу других классов и формурует статистику.
+        После вызывает класс генерирующий Exel и pdf файлы, а также
+        создающий изображение с диаграммами.
+        Параметры, переданные в конструктор, не запрашиваются у пользователя.
+
+        Args:
+            name_file (str): Имя файла
+            name_vacancy (str or list): Название профессии по которой собирается статистика или список названий.
+                Статистика по всем профессиям из списка собирается за один проход по данным
+            loaded_columns (tuple): Уже загруженные данные файла (результат DataSet.load_columns),
+                чтобы не читать файл повторно для каждой профессии
+            is_report (bool): Формировать ли файлы отчета
+            pdf_backend (str): Модуль вывода pdf (ключ Report.pdf_backends)
+            output_spec (OutputSpec): Размещение файлов отчета (по умолчанию - OutputSpec())
+            sinks (tuple): Модули вывода (по умолчанию - InputConnect.sinks)
+        """
+        self.name_file = name_file if name_file is not None else input('Введите название файла: ')
+        self.name_vacancy = name_vacancy if name_vacancy is not None else input('Введите название профессии: ')
+
+        if isinstance(self.name_vacancy, str) and loaded_columns is None:
+            statistics = {self.name_vacancy: DataSet(self.name_file, self.name_vacancy).make_statistic()}
+        else:
+            name_vacancies = [self.name_vacancy] if isinstance(self.name_vacancy, str) else list(self.name_vacancy)
+            statistics = DataSet(self.name_file, '').make_statistics(name_vacancies, loaded_columns)
+        self.output(statistics, is_report, pdf_backend, output_spec, sinks)
+
+    @staticmethod
+    def output(statistics, is_report=True, pdf_backend='native', output_spec=None, sinks=None):
+        """Выводит статистику и формирует отчеты (см. ReportScheduler). Если профессий несколько,
+        перед статистикой выводится название профессии, а кроме файлов отчета каждой профессии
+        записывается общая книга Excel по всем профессиям (см. OutputSpec.path)
+
+        Args:
+            statistics (dict): Словарь статистики по профессиям (название профессии - кортеж из 6 словарей)
+            is_report (bool): Формировать ли файлы отчета
+            pdf_backend (str): Модуль вывода pdf (ключ Report.pdf_backends)
+            output_spec (OutputSpec): Размещение файлов отчета (по умолчанию - OutputSpec())
+            sinks (tuple): Модули вывода (по умолчанию - InputConnect.sinks)
+        """
+        sinks = InputConnect.sinks if sinks is None else sinks
+        for sink in sinks:
+            if sink != 'console' and sink not in Report.stages:
+                print('Неизвестный модуль вывода: {0}'.format(sink))
+                exit()
+        if 'console' in sinks:
+            for name_vacancy, (first_statistical_data, second_statistical_data, third_statistical_data,
+                               fourth_statistical_data, fifth_statistical_data,
+                               sixth_statistical_data) in statistics.items():
+                if len(statistics) > 1:
+                    print('Профессия: {0}'.format(name_vacancy))
+                DataSet.output_statistics(first_statistical_data, second_statistical_data, third_statistical_data,
+                                          fourth_statistical_data,
+                                          fifth_statistical_data, sixth_statistical_data)
+        stages = [sink for sink in sinks if sink != 'console']
+        if not is_report or not stages:
+            return
+
+        output_spec = output_spec or OutputSpec()
+        output_spec.check(len(statistics))
+        scheduler = ReportScheduler(pdf_backend=pdf_backend, stages=stages)
+        scheduler.render([(name_vacancy, data, output_spec) for name_vacancy, data in statistics.items()])
+        scheduler.output_timings()
+        if len(statistics) > 1 and 'excel' in scheduler.stages:
+            with output_spec.atomic(output_spec.path('report.xlsx')) as path:
+                ExcelWriter.write_professions(statistics, path)
+
+
+class OutputSpec:
+    """Класс, описывающий размещение файлов отчетов: папку и шаблон пути файла внутри нее.
+    В шаблоне доступны поля {profession} (название профессии, символы, недопустимые в именах файлов,
+    заменяются на _), {run} (идентификатор запуска) и {file} (имя файла: report.xlsx, graph.png, report.pdf).
+    Файлы записываются атомарно: сначала во временный файл в той же папке, затем он переименовывается,
+    поэтому одновременно формируемые отчеты не видят недописанных файлов и не смешивают их содержимое
+
+    Attributes:
+        directory (Path): Папка отчетов
+        template (str): Шаблон пути файла отчета относительно папки отчетов
+        run (str): Идентификатор запуска (по умолчанию - время запуска и номер процесса)
+        image_cache (Path): Папка кэша изображений (по умолчанию - .graph_cache в папке отчетов,
+            см. Report.generate_image)
+        unsafe_characters (Pattern): Скомпилированное регулярное выражение для символов,
+            недопустимых в именах файлов
+        file_mode (int): Права новых файлов отчета (0666 с учетом umask, umask читается один раз при импорте)
+    """
+    unsafe_characters = re.compile(r'[^\w\- +#.]+')
+    umask = os.umask(0o022)
+    os.umask(umask)
+    file_mode = 0o666 & ~umask
+    del umask
+
+    def __init__(self, directory='reports', template='{profession}/{file}', run=None, image_cache=None):
+        """Инициализирует объект OutputSpec
+
+        Args:
+            directory (str): Папка отчетов
+            template (str): Шаблон пути файла отчета
+            run (str): Идентификатор запуска
+            image_cache (str): Папка кэша изображений
+        """
+        self.directory = pathlib.Path(directory)
+        self.template = template
+        self.run = run or '{0}-{1}'.format(time.strftime('%Y%m%d-%H%M%S'), os.getpid())
+        self.image_cache = pathlib.Path(image_cache) if image_cache is not None else self.directory / '.graph_cache'
+
+    def check(self, professions_count):
+        """Проверяет шаблон: допустимы только поля profession, run и file, поле file обязательно,
+        при нескольких профессиях шаблон должен содержать поле profession.
+        При ошибке выводит сообщение и завершает программу
+
+        Args:
+            professions_count (int): Количество профессий
+        """
+        try:
+            self.template.format(profession='', run='', file='')
+        except (KeyError, IndexError, ValueError):
+            print('Неверно задан шаблон имени файла: {0}'.format(self.template))
+            exit()
+        if '{file}' not in self.template:
+            print('Шаблон имени файла должен содержать поле {{file}}: {0}'.format(self.template))
+            exit()
+        if professions_count > 1 and '{profession}' not in self.template:
+            print('Для нескольких профессий шаблон имени файла должен содержать поле {{profession}}: {0}'
+                  .format(self.template))
+            exit()
+
+    def path(self, name_file, name_vacancy=None):
+        """Формирует путь к файлу отчета и создает его папку. Для общего файла по нескольким профессиям
+        поле profession пустое, и пустые части пути пропускаются: при шаблоне {run}/{profession}/{file}
+        общий файл записывается в папку запуска рядом с папками профессий
+
+        Args:
+            name_file (str): Имя файла
+            name_vacancy (str): Название профессии (None - общий файл по нескольким профессиям)
+
+        Returns:
+            str: путь к файлу
+        """
+        profession = '' if name_vacancy is None else self.unsafe_characters.sub('_', name_vacancy).strip('.') or '_'
+        relative = self.template.format(profession=profession, run=self.run, file=name_file)
+        path = self.directory.joinpath(*[part for part in re.split(r'[/\\]', relative) if part])
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return str(path)
+
+    @staticmethod
+    @contextmanager
+    def atomic(path):
+        """Атомарная запись файла: внутри блока with файл записывается по временному пути в той же папке
+        (с тем же расширением, по которому библиотеки определяют формат), после успешного завершения блока
+        временный файл переименовывается в path, при ошибке - удаляется. mkstemp создает файл с правами 0600,
+        поэтому сразу после создания права меняются на file_mode
+
+        Args:
+            path (str): Путь к файлу
+
+        Returns:
+            str: временный путь для записи (значение блока with)
+        """
+        path = pathlib.Path(path)
+        descriptor, temporary_path = tempfile.mkstemp(suffix='.tmp' + path.suffix, prefix='.' + path.stem + '.',
+                                                      dir=path.parent)
+        try:
+            if hasattr(os, 'fchmod'):
+                os.fchmod(descriptor, OutputSpec.file_mode)
+        finally:
+            os.close(descriptor)
+        try:
+            yield temporary_path
+            os.replace(temporary_path, path)
+        finally:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
+
+class NativePdfBackend:
+    """Модуль вывода pdf без внешних программ: страница A4 с заголовком, изображением graph.png и таблицами
+    строится объектным интерфейсом matplotlib и записывается его pdf-модулем в том же процессе.
+    Шрифт встраивается как TrueType, поэтому текст в файле можно выделять и искать
+
+    Attributes:
+        page_size (tuple): Размер страницы в дюймах
+        font_size (int): Размер шрифта таблиц
+    """
+    page_size = (8.27, 11.69)
+    font_size = 7
+
+    def render(self, context, path):
+        """Формирует pdf-файл
+
+        Args:
+            context (dict): Данные отчета (см. Report.pdf_context)
+            path (str): Путь к pdf-файлу
+        """
+        self.render_many([(context, path)])
+
+    def render_many(self, reports):
+        """Формирует pdf-файлы нескольких отчетов
+
+        Args:
+            reports (list): Кортежи (данные отчета, путь к pdf-файлу)
+        """
+        import matplotlib
+        from matplotlib.backends.backend_pdf import FigureCanvasPdf
+
+        with matplotlib.rc_context({'pdf.fonttype': 42}):
+            for context, path in reports:
+                fig = self.make_page(context)
+                FigureCanvasPdf(fig).print_pdf(path)
+
+    def make_page(self, context):
+        """Строит страницу отчета
+
+        Args:
+            context (dict): Данные отчета (см. Report.pdf_context)
+
+        Returns:
+            Figure: страница
+        """
+        from matplotlib.figure import Figure
+        from matplotlib.image import imread
+
+        fig = Figure(figsize=self.page_size)
+        name = context['name']
+        fig.text(0.5, 0.965, 'Аналитика по зарплатам и городам для профессии {0}'.format(name), ha='center',
+                 va='top', fontsize=13, fontweight='bold', wrap=True)
+        image_ax = fig.add_axes([0.1, 0.6, 0.8, 0.34])
+        image_ax.imshow(imread(context['path']))
+        image_ax.set_axis_off()
+
+        fig.text(0.5, 0.585, 'Статистика по годам', ha='center', va='top', fontsize=11, fontweight='bold')
+        self.add_table(fig, [0.05, 0.3, 0.9, 0.27],
+                       ['Год', 'Средняя зарплата', 'Средняя зарплата - ' + name, 'Количество вакансий',
+                        'Количество вакансий - ' + name], context['statistical_data'])
+
+        fig.text(0.5, 0.285, 'Статистика по городам', ha='center', va='top', fontsize=11, fontweight='bold')
+        self.add_table(fig, [0.05, 0.03, 0.43, 0.24], ['Город', 'Уровень зарплат'],
+                       [[city, value] for city, value in context['fifth_statistical_data'].items()])
+        self.add_table(fig, [0.52, 0.03, 0.43, 0.24], ['Город', 'Доля вакансий'],
+                       [[city, '{0}%'.format(value)] for city, value in context['sixth_statistical_data'].items()])
+        return fig
+
+    def add_table(self, fig, rect, headings, rows):
+        """Добавляет на страницу таблицу с рамками, прижатую к верхнему краю области.
+        Длинные заголовки переносятся после " - "
+
+        Args:
+            fig (Figure): Страница
+            rect (list): Область таблицы (левый край, нижний край, ширина, высота) в долях страницы
+            headings (list): Заголовки столбцов
+            rows (list): Строки таблицы
+        """
+        ax = fig.add_axes(rect)
+        ax.set_axis_off()
+        if not rows:
+            return
+        headings = [heading.replace(' - ', ' -\n') for heading in headings]
+        heading_lines = max(heading.count('\n') + 1 for heading in headings)
+        row_height = min(1 / (len(rows) + heading_lines), 0.08)
+        height = row_height * (len(rows) + heading_lines)
+        table = ax.table(cellText=[[str(cell) for cell in row] for row in rows], colLabels=headings,
+                         cellLoc='center', bbox=[0, 1 - height, 1, height])
+        table.auto_set_font_size(False)
+        table.set_fontsize(self.font_size)
+        for (row, column), cell in table.get_celld().items():
+            if row == 0:
+                cell.set_text_props(fontweight='bold')
+                cell.set_height(cell.get_height() * heading_lines)
+
+
+class HtmlPdfBackend:
+    """Модуль вывода pdf через шаблон pdf_template.html и программу wkhtmltopdf (библиотеки jinja2 и pdfkit).
+    Скомпилированный шаблон кэшируется и используется для всех отчетов
+
+    Attributes:
+        wkhtmltopdf (str): Путь к программе wkhtmltopdf
+        template_directory (str): Папка шаблона
+    """
+
+    def __init__(self, wkhtmltopdf=None, template_directory=None):
+        """Инициализирует объект HtmlPdfBackend
+
+        Args:
+            wkhtmltopdf (str): Путь к программе wkhtmltopdf (по умолчанию - найденная в PATH или стандартный путь
+                установки в Windows)
+            template_directory (str): Папка шаблона (по умолчанию - папка программы)
+        """
+        self.wkhtmltopdf = wkhtmltopdf or shutil.which('wkhtmltopdf') or \
+            r'C:\Program Files\wkhtmltopdf\bin\wkhtmltopdf.exe'
+        self.template_directory = template_directory or str(pathlib.Path(__file__).parent.resolve())
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_template(template_directory):
+        """Загружает и компилирует шаблон pdf_template.html, результат запоминается
+
+        Args:
+            template_directory (str): Папка шаблона
+
+        Returns:
+            Template: шаблон
+        """
+        from jinja2 import Environment, FileSystemLoader
+
+        return Environment(loader=FileSystemLoader(template_directory)).get_template('pdf_template.html')
+
+    def render(self, context, path):
+        """Формирует pdf-файл
+
+        Args:
+            context (dict): Данные отчета (см. Report.pdf_context)
+            path (str): Путь к pdf-файлу
+        """
+        import pdfkit
+
+        pdfkit.from_string(self.get_template(self.template_directory).render(context), path,
+                           configuration=pdfkit.configuration(wkhtmltopdf=self.wkhtmltopdf),
+                           options={"enable-local-file-access": None})
+
+    def render_many(self, reports):
+        """Формирует pdf-файлы нескольких отчетов с одним скомпилированным шаблоном
+
+        Args:
+            reports (list): Кортежи (данные отчета, путь к pdf-файлу)
+        """
+        for context, path in reports:
+            self.render(context, path)
+
+
+class Report:
+    """Класс отвечающий за формирование файлов (pdf, Exel и изображение с диаграммами).
+    Библиотеки openpyxl, matplotlib, jinja2 и pdfkit импортируются только при формировании соответствующего файла,
+    поэтому импорт модуля для подсчета статистики или вывода вакансий их не загружает
+
+    Attributes:
+        workbook (Workbook): экземпляр рабочей книги для создания Exel файла (создается в generate_excel)
+        sixth_statistical_data (dict): Доля вакансий по городам (в порядке убывания)
+        fifth_statistical_data (dict): Уровень зарплат по городам (в порядке убывания)
+        fourth_statistical_data (dict): Динамика количества вакансий по годам для выбранной профессии
+        third_statistical_data (dict): Динамика уровня зарплат по годам для выбранной профессии
+        second_statistical_data (dict): Динамика количества вакансий по годам
+        first_statistical_data (dict): Динамика уровня зарплат по годам
+        name_vacancy (str): Название профессии
+        output_spec (OutputSpec): Размещение файлов отчета (в том числе папка кэша изображений)
+        image_cache_size (int): Наибольшее количество изображений в кэше
+        image_version (int): Версия построения изображения, входит в хэш содержимого (увеличивается
+            при изменении диаграмм, чтобы не использовать старые изображения из кэша)
+        pdf_backends (dict): Модули вывода pdf (название - класс)
+        pdf_backend (str): Модуль вывода pdf отчета
+        stages (dict): Этапы формирования файлов отчета (этап - этап, файл которого он использует, или None).
+            Этап stage выполняется методом generate_<stage>, новый модуль вывода добавляется методом и ключом
+    """
+    image_cache_size = 256
+    image_version = 1
+    pdf_backends = {'native': NativePdfBackend, 'wkhtmltopdf': HtmlPdfBackend}
+    stages = {'excel': None, 'image': None, 'pdf': 'image'}
+
+    def __init__(self, name_vacancy, first_statistical_data, second_statistical_data, third_statistical_data,
+                 fourth_statistical_data,
+                 fifth_statistical_data, sixth_statistical_data, output_spec=None, pdf_backend='native'):
+        """Инициализирует объект Report
+        Args:
+            name_vacancy (str): Название профессии
+            first_statistical_data (dict): Динамика уровня зарплат по годам
+            second_statistical_data (dict): Динамика количества вакансий по годам
+            third_statistical_data (dict): Динамика уровня зарплат по годам для выбранной профессии
+            fourth_statistical_data (dict): Динамика количества вакансий по годам для выбранной профессии
+            fifth_statistical_data (dict): Уровень зарплат по городам (в порядке убывания)
+            sixth_statistical_data (dict): Доля вакансий по городам (в порядке убывания)
+            output_spec (OutputSpec): Размещение файлов отчета (по умолчанию - OutputSpec())
+            pdf_backend (str): Модуль вывода pdf (ключ pdf_backends)
+        """
+        self.workbook = None
+        self.sixth_statistical_data = sixth_statistical_data
+        self.fifth_statistical_data = fifth_statistical_data
+        self.fourth_statistical_data = fourth_statistical_data
+        self.third_statistical_data = third_statistical_data
+        self.second_statistical_data = second_statistical_data
+        self.first_statistical_data = first_statistical_data
+        self.name_vacancy = name_vacancy
+        self.output_spec = output_spec or OutputSpec()
+        self.pdf_backend = pdf_backend
+
+    def output_path(self, name_file):
+        """Формирует путь к файлу отчета
+
+        Args:
+            name_file (str): Имя файла
+
+        Returns:
+            str: путь к файлу отчета профессии (см. OutputSpec.path)
+        """
+        return self.output_spec.path(name_file, self.name_vacancy)
+
+    @staticmethod
+    def make_widths(informations):
+        """Регулирует ширину столбцов в зависимости от количества информации в них
+        informations (list): список информации строк из таблицы (каждый элемент - отдельный столбец)
+
+        Returns:
+            list: список значений ширины для столбцов таблицы
+        """
+        widths = []
+        for inf in informations:
+            for i, cell in enumerate(inf):
+                cell = str(cell)
+                if len(widths) <= i:
+                    widths += [len(cell)]
+                else:
+                    if len(cell) > widths[i]:
+                        widths[i] = len(cell)
+        return widths
+
+    def generate_excel(self):
+        """Генерация Exel файла и таблиц в нем (Использовалась библиотека openpyxl, см. ExcelWriter)
+        Генерируется файл report.xlsx (путь задается output_spec)
+        """
+        writer = ExcelWriter()
+        self.workbook = writer.workbook
+        writer.add_years_sheet('Статистика по годам', self.name_vacancy, self.first_statistical_data,
+                               self.second_statistical_data, self.third_statistical_data,
+                               self.fourth_statistical_data)
+        writer.add_cities_sheet(self.fifth_statistical_data, self.sixth_statistical_data)
+        with self.output_spec.atomic(self.output_path('report.xlsx')) as path:
+            writer.save(path)
+
+    @staticmethod
+    def make_axes(ax, first_bar, second_bar, name_vacancy, statistical_data, first_legend_str, second_legend_str):
+        """Формирует график
+
+        Args:
+            ax (AxesSubplot): Область диаграммы
+            first_bar (BarContainer): статистические данные средних величин для всех вакансий
+            second_bar (BarContainer): статистические данные средних величин для заданной профессии
+            name_vacancy (str): Название профессии
+            statistical_data (dict): Статистические данные
+            first_legend_str (str): Подпись в легенде
+            second_legend_str (str): Подпись в легенде
+        """
+        ax.grid(axis='y')
+
+        ax.legend((first_bar[0], second_bar[0]), (first_legend_str, second_legend_str + name_vacancy.lower()),
+                  prop={'size': 8})
+
+        ax.set_xticks(np.array(list(statistical_data.keys())) - 0.2,
+                      list(statistical_data.keys()), rotation=90)
+        ax.xaxis.set_tick_params(labelsize=8)
+        ax.yaxis.set_tick_params(labelsize=8)
+
+    def image_key(self):
+        """Вычисляет хэш содержимого изображения: названия профессии и всех словарей статистики
+
+        Returns:
+            str: хэш SHA-256 в шестнадцатеричном виде
+        """
+        content = [self.image_version, self.name_vacancy] + [
+            list(data.items()) for data in (self.first_statistical_data, self.second_statistical_data,
+                                            self.third_statistical_data, self.fourth_statistical_data,
+                                            self.fifth_statistical_data, self.sixth_statistical_data)]
+        return hashlib.sha256(json.dumps(content, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+    def generate_image(self):
+        """Генерация изображения и диаграмм в ней (Использовались библиотеки matplotlib и numpy)
+        Генерируется файл graph.png (путь задается output_spec).
+        Готовые изображения хранятся в папке кэша (output_spec.image_cache) под хэшем содержимого (см. image_key):
+        если изображение с такой же статистикой уже строилось, оно копируется без повторного построения.
+        Кэш ограничен image_cache_size изображениями (см. prune_image_cache)
+        """
+        cached_path = self.output_spec.image_cache / '{0}.png'.format(self.image_key())
+        if cached_path.exists():
+            try:
+                with self.output_spec.atomic(self.output_path('graph.png')) as path:
+                    shutil.copyfile(cached_path, path)
+                os.utime(cached_path)
+                return
+            except FileNotFoundError:
+                pass
+        with self.output_spec.atomic(self.output_path('graph.png')) as path:
+            self.render_image(path)
+            self.output_spec.image_cache.mkdir(parents=True, exist_ok=True)
+            with self.output_spec.atomic(cached_path) as temporary_path:
+                shutil.copyfile(path, temporary_path)
+        self.prune_image_cache()
+
+    def prune_image_cache(self):
+        """Удаляет из кэша изображений давно не использованные изображения сверх image_cache_size
+        (время использования - время изменения файла, оно обновляется при каждом копировании из кэша).
+        Временные файлы одновременно записываемых изображений (имена начинаются с точки) не удаляются
+        """
+        cached_paths = []
+        for cached_path in self.output_spec.image_cache.glob('[!.]*.png'):
+            try:
+                cached_paths.append((cached_path.stat().st_mtime, cached_path))
+            except FileNotFoundError:
+                pass
+        cached_paths.sort(reverse=True)
+        for _, cached_path in cached_paths[self.image_cache_size:]:
+            try:
+                cached_path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def render_image(self, path):
+        """Строит изображение с диаграммами. Используется объектный интерфейс matplotlib с модулем вывода Agg:
+        фигура не регистрируется в pyplot и освобождается после записи файла
+
+        Args:
+            path (str): Путь к файлу изображения
+        """
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        fig = Figure()
+        FigureCanvasAgg(fig)
+        ((first_ax, second_ax), (third_ax, fourth_ax)) = fig.subplots(nrows=2, ncols=2)
+
+        first_bar = first_ax.bar(np.array(list(self.first_statistical_data.keys())) - 0.4,
+                                 self.first_statistical_data.values(), width=0.4)
+        second_bar = first_ax.bar(np.array(list(self.first_statistical_data.keys())),
+                                  self.third_statistical_data.values(), width=0.4)
+        first_ax.set_title('Уровень зарплат по годам', fontdict={'fontsize': 8})
+
+        self.make_axes(first_ax, first_bar, second_bar, self.name_vacancy, self.first_statistical_data, 'средняя з/п',
+                       'з/п ')
+
+        second_ax.set_title('Количество вакансий по годам', fontdict={'fontsize': 8})
+        first_bar = second_ax.bar(np.array(list(self.second_statistical_data.keys())) - 0.4,
+                                  self.second_statistical_data.values(), width=0.4)
+        second_bar = second_ax.bar(np.array(list(self.second_statistical_data.keys())),
+                                   self.fourth_statistical_data.values(), width=0.4)
+
+        self.make_axes(second_ax, first_bar, second_bar, self.name_vacancy, self.second_statistical_data,
+                       'Количество вакансий', 'Количество вакансий\n')
+
+        third_ax.set_title('Уровень зарплат по городам', fontdict={'fontsize': 8})
+        third_ax.barh(list([str(a).replace(' ', '\n').replace('-', '-\n') for a in
+                            reversed(list(self.fifth_statistical_data.keys()))]),
+                      list(reversed(list(self.fifth_statistical_data.values()))), color='blue', height=0.5,
+                      align='center')
+        third_ax.grid(axis='x')
+        third_ax.xaxis.set_tick_params(labelsize=8)
+        third_ax.yaxis.set_tick_params(labelsize=6)
+
+        fourth_ax.set_title('Доля вакансий по городам', fontdict={'fontsize': 8})
+        remainder_list = [val for val in self.sixth_statistical_data.values()]
+        remainder = 1 - sum(remainder_list)
+        sixth_statistical_data = self.sort_shares(self.sixth_statistical_data)
+        fourth_ax.pie(list(sixth_statistical_data.values()) + [remainder],
+                      labels=list(sixth_statistical_data.keys()) + ['Другие'],
+                      textprops={'fontsize': 6})
+        fig.tight_layout()
+        fig.savefig(path)
+
+    @staticmethod
+    def sort_shares(sixth_statistical_data):
+        """Упорядочивает доли вакансий по городам по возрастанию (порядок круговой диаграммы и таблицы в pdf)
+
+        Args:
+            sixth_statistical_data (dict): Доля вакансий по городам
+
+        Returns:
+            dict: доли вакансий по городам в порядке возрастания
+        """
+        return dict(sorted(sixth_statistical_data.items(), key=lambda x: x[1]))
+
+    def pdf_context(self):
+        """Собирает данные для pdf-файла: таблица по годам (в том же порядке столбцов, что и в Excel),
+        уровень зарплат и доли вакансий (в процентах) по городам, путь к изображению
+
+        Returns:
+            dict: данные для шаблона pdf_template.html и для NativePdfBackend
+        """
+        sixth_statistical_data = {key: round(value * 100, 2)
+                                  for key, value in self.sort_shares(self.sixth_statistical_data).items()}
+        statistical_data = []
+        for year in self.first_statistical_data.keys():
+            statistical_data.append([year, self.first_statistical_data[year], self.third_statistical_data[year],
+                                     self.second_statistical_data[year], self.fourth_statistical_data[year]])
+        return {'name': self.name_vacancy,
+                'path': str(pathlib.Path(self.output_path('graph.png')).resolve()),
+                'statistical_data': statistical_data, 'fifth_statistical_data': self.fifth_statistical_data,
+                'sixth_statistical_data': sixth_statistical_data}
+
+    def generate_pdf(self):
+        """Генерация pdf файла, содержащего в себе диаграммы и таблицу сгенерированные ранее
+        (см. NativePdfBackend и HtmlPdfBackend, модуль вывода задается атрибутом pdf_backend)
+        Рядом с report.xlsx и graph.png генерируется файл report.pdf.
+        Изображение graph.png должно быть сформировано до вызова метода
+        """
+        with self.output_spec.atomic(self.output_path('report.pdf')) as path:
+            self.pdf_backends[self.pdf_backend]().render(self.pdf_context(), path)
+
+    @staticmethod
+    def generate_pdfs(reports, pdf_backend='native'):
+        """Генерация pdf файлов для нескольких отчетов за один вызов модуля вывода
+
+        Args:
+            reports (list): Отчеты (Report), изображения которых уже сформированы
+            pdf_backend (str): Модуль вывода pdf (ключ Report.pdf_backends)
+        """
+        with ExitStack() as stack:
+            paths = [stack.enter_context(report.output_spec.atomic(report.output_path('report.pdf')))
+                     for report in reports]
+            Report.pdf_backends[pdf_backend]().render_many(
+                [(report.pdf_context(), path) for report, path in zip(reports, paths)])
+
+
+class ExcelWriter:
+    """Класс для формирования Excel файлов со статистикой. Оформление задается именованными стилями книги,
+    которые создаются один раз: ячейки ссылаются на стиль, а не хранят собственные шрифт и рамки.
+    В потоковом режиме (write_only) строки листа записываются сразу во временный файл, поэтому память
+    не зависит от количества строк и листов
+
+    Attributes:
+        workbook (Workbook): Рабочая книга
+        write_only (bool): Потоковый режим записи
+        sheet_title (Pattern): Скомпилированное регулярное выражение для символов, недопустимых в названии листа
+    """
+    sheet_title = re.compile(r'[\[\]:*?/\\]')
+
+    def __init__(self, write_only=True):
+        """Инициализирует объект ExcelWriter, создает книгу и именованные стили: header (заголовок с рамкой),
+        cell (ячейка с рамкой), percent (доля в процентах с рамкой) и bold (заголовок без рамки)
+
+        Args:
+            write_only (bool): Потоковый режим записи
+        """
+        from openpyxl import Workbook
+        from openpyxl.styles import Border, Font, NamedStyle, Side
+
+        self.write_only = write_only
+        self.workbook = Workbook(write_only=write_only)
+        if not write_only:
+            self.workbook.remove(self.workbook.active)
+        side = Side(border_style='thin', color='00000000')
+        border = Border(left=side, bottom=side, right=side, top=side)
+        for name, font, cell_border, number_format in (('header', Font(bold=True), border, 'General'),
+                                                       ('cell', Font(), border, 'General'),
+                                                       ('percent', Font(), border, '0.00%'),
+                                                       ('bold', Font(bold=True), Border(), 'General')):
+            style = NamedStyle(name=name, font=font, border=cell_border, number_format=number_format)
+            self.workbook.add_named_style(style)
+
+    def append(self, sheet, values, styles):
+        """Добавляет строку в конец листа
+
+        Args:
+            sheet (Worksheet): Лист
+            values (list): Значения ячеек
+            styles (list): Названия стилей ячеек (None - без стиля)
+        """
+        if self.write_only:
+            from openpyxl.cell import WriteOnlyCell
+
+            row = []
+            for value, style in zip(values, styles):
+                cell = WriteOnlyCell(sheet, value=value)
+                if style is not None:
+                    cell.style = style
+                row.append(cell)
+            sheet.append(row)
+            return
+        sheet.append(values)
+        row = sheet.max_row
+        for column, style in enumerate(styles, 1):
+            if style is not None:
+                sheet.cell(row=row, column=column).style = style
+
+    def create_sheet(self, title, informations):
+        """Создает лист и задает ширину столбцов по содержимому (в потоковом режиме ширина задается
+        до записи строк)
+
+        Args:
+            title (str): Название листа
+            informations (list): Информация строк, по которой определяется ширина столбцов
+
+        Returns:
+            Worksheet: лист
+        """
+        from openpyxl.utils import get_column_letter
+
+        sheet = self.workbook.create_sheet(self.sheet_title.sub('_', title)[:31])
+        for i, width in enumerate(Report.make_widths(informations), 1):
+            sheet.column_dimensions[get_column_letter(i)].width = width + 2
+        return sheet
+
+    def add_years_sheet(self, title, name_vacancy, first_statistical_data, second_statistical_data,
+                        third_statistical_data, fourth_statistical_data):
+        """Добавляет лист статистики по годам
+
+        Args:
+            title (str): Название листа
+            name_vacancy (str): Название профессии
+            first_statistical_data (dict): Динамика уровня зарплат по годам
+            second_statistical_data (dict): Динамика количества вакансий по годам
+            third_statistical_data (dict): Динамика уровня зарплат по годам для выбранной профессии
+            fourth_statistical_data (dict): Динамика количества вакансий по годам для выбранной профессии
+        """
+        sheet = self.create_sheet(title, [
+            ['Год ', 'Средняя зарплата ', ' Средняя зарплата - ' + name_vacancy, ' Количество вакансий',
+             ' Количество вакансий - ' + name_vacancy]])
+        self.append(sheet, ['Год', 'Средняя зарплата', 'Средняя зарплата - ' + name_vacancy, 'Количество вакансий',
+                            'Количество вакансий - ' + name_vacancy], ['header'] * 5)
+        for year in first_statistical_data.keys():
+            self.append(sheet, [year, first_statistical_data[year], third_statistical_data[year],
+                                second_statistical_data[year], fourth_statistical_data[year]], ['cell'] * 5)
+
+    def add_cities_sheet(self, fifth_statistical_data, sixth_statistical_data):
+        """Добавляет лист статистики по городам
+
+        Args:
+            fifth_statistical_data (dict): Уровень зарплат по городам (в порядке убывания)
+            sixth_statistical_data (dict): Доля вакансий по городам (в порядке убывания)
+        """
+        informations = [['Город', 'Уровень зарплат', '', 'Город', 'Доля вакансий']]
+        for (first_city, first_value), (second_city, second_value) in zip(fifth_statistical_data.items(),
+                                                                          sixth_statistical_data.items()):
+            informations.append([first_city, first_value, '', second_city, second_value])
+        sheet = self.create_sheet('Статистика по городам', informations)
+        self.append(sheet, informations[0], ['header', 'header', 'bold', 'header', 'header'])
+        for inf in informations[1:]:
+            self.append(sheet, inf, ['cell', 'cell', None, 'cell', 'percent'])
+
+    def save(self, path):
+        """Записывает книгу в файл
+
+        Args:
+            path (str): Путь к файлу
+        """
+        self.workbook.save(path)
+
+    @classmethod
+    def write_professions(cls, statistics, path):
+        """Формирует одну книгу для нескольких профессий: лист статистики по годам для каждой профессии
+        и общий лист статистики по городам
+
+        Args:
+            statistics (dict): Словарь статистики по профессиям (название профессии - кортеж из 6 словарей)
+            path (str): Путь к файлу
+        """
+        writer = cls()
+        for name_vacancy, (first_statistical_data, second_statistical_data, third_statistical_data,
+                           fourth_statistical_data, fifth_statistical_data,
+                           sixth_statistical_data) in statistics.items():
+            writer.add_years_sheet(name_vacancy, name_vacancy, first_statistical_data, second_statistical_data,
+                                   third_statistical_data, fourth_statistical_data)
+        writer.add_cities_sheet(fifth_statistical_data, sixth_statistical_data)
+        writer.save(path)
+
+
+class ReportScheduler:
+    """Класс для одновременного формирования файлов отчетов в нескольких процессах. Этапы, не зависящие
+    от других (файлы Excel и изображения), запускаются сразу, зависимый этап (pdf-файл) - как только готов файл,
+    который он использует (изображение, которое встраивается в pdf, см. Report.stages).
+    Отчеты, для которых зависимый этап стал доступен одновременно, формируются пакетами (см. render_batch):
+    не больше одного пакета на процесс, pdf-файлы пакета - одним вызовом модуля вывода (см. Report.generate_pdfs).
+    Время каждого этапа замеряется
+
+    Attributes:
+        processes (int): Количество процессов
+        pdf_backend (str): Модуль вывода pdf
+        stages (list): Выполняемые этапы вместе с этапами, от которых они зависят
+        timings (dict): Время этапов в секундах ((название профессии, этап) - время; для пакета
+            названия профессий перечисляются через запятую)
+        elapsed (float): Общее время формирования отчетов в секундах
+    """
+
+    def __init__(self, processes=None, pdf_backend='native', stages=None):
+        """Инициализирует объект ReportScheduler
+
+        Args:
+            processes (int): Количество процессов (по умолчанию - количество ядер)
+            pdf_backend (str): Модуль вывода pdf (ключ Report.pdf_backends)
+            stages (list): Этапы (ключи Report.stages, по умолчанию - все этапы)
+        """
+        self.processes = processes or os.cpu_count()
+        self.pdf_backend = pdf_backend
+        self.stages = []
+        for stage in Report.stages if stages is None else stages:
+            while stage is not None and stage not in self.stages:
+                self.stages.append(stage)
+                stage = Report.stages[stage]
+        self.timings = {}
+        self.elapsed = 0.0
+
+    def render(self, reports):
+        """Формирует файлы отчетов. Если на каком-то этапе возникла ошибка, она передается дальше после
+        завершения уже запущенных этапов
+
+        Args:
+            reports (list): Отчеты: кортежи (название профессии, кортеж из 6 словарей статистики,
+                размещение файлов отчета OutputSpec или None)
+
+        Returns:
+            dict: время этапов в секундах ((название профессии, этап) - время)
+        """
+        start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=self.processes) as executor:
+            futures = {executor.submit(render_stage, stage, *report, self.pdf_backend): ([report], stage)
+                       for report in reports for stage in self.stages if Report.stages[stage] is None}
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                ready = {}
+                for future in done:
+                    batch, stage = futures.pop(future)
+                    self.timings[(', '.join(report[0] for report in batch), stage)] = future.result()
+                    for next_stage in self.stages:
+                        if Report.stages[next_stage] == stage:
+                            ready.setdefault(next_stage, []).extend(batch)
+                for next_stage, next_reports in ready.items():
+                    for number in range(min(self.processes, len(next_reports))):
+                        batch = next_reports[number::self.processes]
+                        futures[executor.submit(render_batch, next_stage, batch, self.pdf_backend)] = (
+                            batch, next_stage)
+        self.elapsed = time.perf_counter() - start
+        return self.timings
+
+    def output_timings(self):
+        """Выводит время этапов и общее время формирования отчетов
+        """
+        for (name_vacancy, stage), seconds in self.timings.items():
+            print('Время формирования ({0}, {1}): {2:.2f} с'.format(name_vacancy, stage, seconds))
+        print('Общее время формирования отчетов: {0:.2f} с'.format(self.elapsed))
+
+
+def render_stage(stage, name_vacancy, statistics, output_spec, pdf_backend='native'):
+    """Формирует один файл отчета (выполняется в дочернем процессе)
+
+    Args:
+        stage (str): Этап (ключ Report.stages)
+        name_vacancy (str): Название профессии
+        statistics (tuple): Кортеж из 6 словарей статистики
+        output_spec (OutputSpec): Размещение файлов отчета (None - OutputSpec())
+        pdf_backend (str): Модуль вывода pdf (ключ Report.pdf_backends)
+
+    Returns:
+        float: время формирования в секундах
+    """
+    start = time.perf_counter()
+    report = Report(name_vacancy, *statistics, output_spec, pdf_backend)
+    getattr(report, 'generate_' + stage)()
+    return time.perf_counter() - start
+
+
+def render_batch(stage, reports, pdf_backend='native'):
+    """Формирует файлы одного этапа для нескольких отчетов (выполняется в дочернем процессе).
+    pdf-файлы формируются одним вызовом модуля вывода (см. Report.generate_pdfs)
+
+    Args:
+        stage (str): Этап (ключ Report.stages)
+        reports (list): Отчеты: кортежи (название профессии, кортеж из 6 словарей статистики,
+            размещение файлов отчета OutputSpec или None)
+        pdf_backend (str): Модуль вывода pdf (ключ Report.pdf_backends)
+
+    Returns:
+        float: время формирования в секундах
+    """
+    start = time.perf_counter()
+    reports = [Report(name_vacancy, *statistics, output_spec, pdf_backend)
+               for name_vacancy, statistics, output_spec in reports]
+    if stage == 'pdf':
+        Report.generate_pdfs(reports, pdf_backend)
+    else:
+        for report in reports:
+            getattr(report, 'generate_' + stage)()
+    return time.perf_counter() - start
+
+
+def accumulate_chunk(name_file, name_vacancy, headings, start, end):
+    """Собирает накопители статистики по диапазону байтов файла (выполняется в дочернем процессе)
+
+    Args:
+        name_file (str): Имя файла
+        name_vacancy (str): Название профессии
+        headings (list): Заголовки столбцов
+        start (int): Начало диапазона
+        end (int): Конец диапазона
+
+    Returns:
+        tuple: накопители зарплат по годам, по годам для выбранной профессии и по городам
+    """
+    data_set = DataSet(name_file, name_vacancy)
+    reader = csv.reader(DataSet.read_chunk(name_file, start, end))
+    return data_set.accumulate(DataSet.rows_to_dicts(headings, reader))
+
+
+def accumulate_file(name_file, name_vacancy):
+    """Собирает накопители статистики по целому файлу (выполняется в дочернем процессе)
+
+    Args:
+        name_file (str): Имя файла
+        name_vacancy (str): Название профессии
+
+    Returns:
+        tuple: накопители зарплат по годам, по годам для выбранной профессии и по городам
+    """
+    data_set = DataSet(name_file, name_vacancy)
+    return data_set.accumulate(data_set.csv_reader())